@@ -43,7 +43,15 @@ class Settings:
         self.raw_vault_ds = bq_conf["raw_vault"]
         self.business_vault_ds = bq_conf["business_vault"]
         self.consumption_ds = bq_conf["consumption"]
-        
+
+        # Ordered layer name -> dataset mapping (upstream first)
+        self.layer_datasets = {
+            "raw_structured": self.raw_structured_ds,
+            "raw_vault": self.raw_vault_ds,
+            "business_vault": self.business_vault_ds,
+            "consumption": self.consumption_ds,
+        }
+
         self.bq_location = bq_conf["location"]
 
         # Buckets
@@ -0,0 +1,11 @@
+from ._session import create_session
+from .bigquery import AsyncBigQueryClient
+from .storage import AsyncStorageClient
+from .triggers import AsyncComposerTrigger
+
+__all__ = [
+    "create_session",
+    "AsyncBigQueryClient",
+    "AsyncStorageClient",
+    "AsyncComposerTrigger",
+]
@@ -0,0 +1,114 @@
+import asyncio
+import json
+import logging
+from typing import Any
+
+import aiohttp
+
+CLOUD_PLATFORM_SCOPE = "https://www.googleapis.com/auth/cloud-platform"
+
+
+def create_session(limit: int = 100, limit_per_host: int = 50) -> aiohttp.ClientSession:
+    """
+    Creates an aiohttp session with a pooled connector.
+    Pass the same session to several async clients to share keep-alive connections.
+    Must be called from within a running event loop.
+    """
+    connector = aiohttp.TCPConnector(limit=limit, limit_per_host=limit_per_host)
+    return aiohttp.ClientSession(connector=connector)
+
+
+class AsyncGoogleClient:
+    """
+    Base for the asyncio clients: owns (or borrows) an aiohttp session, caches the
+    auth token and caps in-flight requests per client with a semaphore.
+    """
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession | None = None,
+        max_concurrency: int = 10,
+        credentials=None,
+    ):
+        self._session = session
+        self._owns_session = session is None
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._credentials = credentials
+        self._token_lock = asyncio.Lock()
+        self.logger = logging.getLogger(self.__class__.__module__)
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = create_session()
+            self._owns_session = True
+        return self._session
+
+    async def close(self):
+        """Closes the session if this client created it."""
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def _get_token(self, force_refresh: bool = False) -> str:
+        """
+        Returns an OAuth access token from Application Default Credentials,
+        refreshed when it is no longer valid or when forced (after a 401).
+        """
+        # google-auth is synchronous; token refreshes are rare so run them in a thread
+        from google.auth.transport.requests import Request
+        import google.auth
+
+        async with self._token_lock:
+            if self._credentials is None:
+                self._credentials, _ = await asyncio.to_thread(
+                    google.auth.default, scopes=[CLOUD_PLATFORM_SCOPE]
+                )
+            if force_refresh or not self._credentials.valid:
+                await asyncio.to_thread(self._credentials.refresh, Request())
+            return self._credentials.token
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        *,
+        allow_not_found: bool = False,
+        raw: bool = False,
+        headers: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any] | bytes | None:
+        """
+        Sends an authenticated request and returns the decoded JSON body, or the
+        body as bytes when `raw` is set. Returns None on 404 when
+        `allow_not_found` is set; retries once with a fresh token on 401 and
+        raises RuntimeError on any other non-2xx response.
+        """
+        for force_refresh in (False, True):
+            token = await self._get_token(force_refresh=force_refresh)
+            request_headers = {"Authorization": f"Bearer {token}", **(headers or {})}
+
+            async with self._semaphore:
+                async with self.session.request(
+                    method, url, headers=request_headers, **kwargs
+                ) as response:
+                    status = response.status
+                    body = await response.read()
+            if status != 401:
+                break
+            self.logger.info(f"{method} {url} returned 401; refreshing token")
+
+        if status == 404 and allow_not_found:
+            return None
+        if status >= 300:
+            text = body.decode(errors="replace")
+            raise RuntimeError(f"{method} {url} failed: {status} - {text}")
+        if raw:
+            return body
+        # DELETE and similar calls answer with an empty body
+        return json.loads(body) if body else {}
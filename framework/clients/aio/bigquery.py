@@ -0,0 +1,175 @@
+import asyncio
+import base64
+import uuid
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from typing import Any
+
+from ._session import AsyncGoogleClient
+
+BIGQUERY_API = "https://bigquery.googleapis.com/bigquery/v2"
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+_SCALAR_PARSERS = {
+    "INTEGER": int,
+    "INT64": int,
+    "FLOAT": float,
+    "FLOAT64": float,
+    "NUMERIC": Decimal,
+    "BIGNUMERIC": Decimal,
+    "BOOLEAN": lambda v: v == "true",
+    "BOOL": lambda v: v == "true",
+    # Requested with formatOptions.useInt64Timestamp -> microseconds since epoch
+    "TIMESTAMP": lambda v: _EPOCH + timedelta(microseconds=int(v)),
+    "DATE": date.fromisoformat,
+    "DATETIME": datetime.fromisoformat,
+    "TIME": time.fromisoformat,
+    "BYTES": base64.b64decode,
+}
+
+
+def _parse_value(field: dict[str, Any], value: Any) -> Any:
+    if value is None:
+        return None
+    if field.get("mode") == "REPEATED":
+        item_field = {**field, "mode": "NULLABLE"}
+        return [_parse_value(item_field, item["v"]) for item in value]
+    if field["type"] in ("RECORD", "STRUCT"):
+        return _parse_row(field["fields"], value)
+    parser = _SCALAR_PARSERS.get(field["type"])
+    return parser(value) if parser else value
+
+
+def _parse_row(fields: list[dict[str, Any]], row: dict[str, Any]) -> dict[str, Any]:
+    """Converts a REST API row ({"f": [{"v": ...}]}) into a dict of Python values."""
+    return {
+        field["name"]: _parse_value(field, cell["v"])
+        for field, cell in zip(fields, row["f"])
+    }
+
+
+def _table_path(table_id: str) -> str:
+    project_id, dataset_id, table = table_id.split(".")
+    return f"projects/{project_id}/datasets/{dataset_id}/tables/{table}"
+
+
+class AsyncBigQueryClient(AsyncGoogleClient):
+    """asyncio counterpart of BigQueryClient built on the BigQuery REST API."""
+
+    def __init__(
+        self,
+        project_id: str,
+        location: str = "US",
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 10.0,
+        **kwargs: Any,
+    ):
+        super().__init__(**kwargs)
+        self.project_id = project_id
+        self.location = location
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+
+    async def execute_query(self, query: str, job_config=None) -> list[dict[str, Any]]:
+        """Executes a SQL query and returns results as a list of dicts."""
+        self.logger.info(f"Executing query: {query}")
+        query_conf = job_config.to_api_repr()["query"] if job_config else {}
+        body = {
+            "jobReference": {
+                "projectId": self.project_id,
+                "location": self.location,
+                "jobId": f"etl_async_{uuid.uuid4().hex}",
+            },
+            "configuration": {
+                "query": {"useLegacySql": False, **query_conf, "query": query}
+            },
+        }
+        job = await self._request(
+            "POST", f"{BIGQUERY_API}/projects/{self.project_id}/jobs", json=body
+        )
+        job_id = job["jobReference"]["jobId"]
+
+        results_url = f"{BIGQUERY_API}/projects/{self.project_id}/queries/{job_id}"
+        params = {
+            "location": self.location,
+            "timeoutMs": "10000",
+            "formatOptions.useInt64Timestamp": "true",
+        }
+
+        # Poll without blocking the loop; getQueryResults long-polls up to timeoutMs
+        delay = self.poll_interval
+        page = await self._request("GET", results_url, params=params)
+        while not page.get("jobComplete"):
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_poll_interval)
+            page = await self._request("GET", results_url, params=params)
+
+        if "schema" not in page:
+            return []  # DDL/DML statements return no result schema
+
+        fields = page["schema"]["fields"]
+        rows = [_parse_row(fields, row) for row in page.get("rows", [])]
+        while page.get("pageToken"):
+            page = await self._request(
+                "GET", results_url, params={**params, "pageToken": page["pageToken"]}
+            )
+            rows.extend(_parse_row(fields, row) for row in page.get("rows", []))
+        return rows
+
+    async def get_table(self, table_id: str) -> dict[str, Any]:
+        """Retrieves table metadata (REST table resource)."""
+        return await self._request("GET", f"{BIGQUERY_API}/{_table_path(table_id)}")
+
+    async def get_row_count(self, table_id: str) -> int:
+        """Efficiently gets row count from table metadata."""
+        table = await self.get_table(table_id)
+        return int(table["numRows"])
+
+    async def get_table_modified_times(
+        self, dataset_ids: list[str]
+    ) -> dict[str, datetime]:
+        """
+        Returns {"dataset.table": last_modified_time} for every table in the datasets.
+        """
+        query = "\nUNION ALL\n".join(
+            f"SELECT dataset_id, table_id, last_modified_time "
+            f"FROM `{self.project_id}.{dataset_id}.__TABLES__`"
+            for dataset_id in dataset_ids
+        )
+        rows = await self.execute_query(query)
+        return {
+            f"{row['dataset_id']}.{row['table_id']}": datetime.fromtimestamp(
+                row["last_modified_time"] / 1000, tz=timezone.utc
+            )
+            for row in rows
+        }
+
+    async def check_table_exists(self, table_id: str) -> bool:
+        """Checks if a table exists."""
+        table = await self._request(
+            "GET", f"{BIGQUERY_API}/{_table_path(table_id)}", allow_not_found=True
+        )
+        return table is not None
+
+    async def insert_rows(self, table_id: str, rows: list[dict[str, Any]]):
+        """Inserts rows into a table (useful for test setup)."""
+        response = await self._request(
+            "POST",
+            f"{BIGQUERY_API}/{_table_path(table_id)}/insertAll",
+            json={"rows": [{"json": row} for row in rows]},
+        )
+        errors = response.get("insertErrors")
+        if errors:
+            raise RuntimeError(f"Encountered errors while inserting rows: {errors}")
+
+    async def delete_table(self, table_id: str, not_found_ok: bool = True):
+        """Deletes a table."""
+        response = await self._request(
+            "DELETE",
+            f"{BIGQUERY_API}/{_table_path(table_id)}",
+            allow_not_found=not_found_ok,
+        )
+        if response is None:
+            self.logger.info(f"Table {table_id} not found, nothing to delete")
+            return
+        self.logger.info(f"Deleted table {table_id}")
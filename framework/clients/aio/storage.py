@@ -0,0 +1,96 @@
+import asyncio
+from pathlib import Path
+from typing import Any
+from urllib.parse import quote
+
+from ._session import AsyncGoogleClient
+
+STORAGE_API = "https://storage.googleapis.com/storage/v1"
+UPLOAD_API = "https://storage.googleapis.com/upload/storage/v1"
+
+
+def _object_url(bucket: str, path: str) -> str:
+    return f"{STORAGE_API}/b/{bucket}/o/{quote(path, safe='')}"
+
+
+class AsyncStorageClient(AsyncGoogleClient):
+    """asyncio counterpart of StorageClient built on the Cloud Storage JSON API."""
+
+    def __init__(self, project_id: str, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.project_id = project_id
+
+    async def file_exists(self, bucket, path):
+        blob = await self._request(
+            "GET", _object_url(bucket, path), allow_not_found=True
+        )
+        return blob is not None
+
+    async def upload_file(
+        self, bucket_name: str, source_file_path: str, destination_blob_name: str
+    ):
+        """Uploads a file to the bucket."""
+        self.logger.info(
+            f"Uploading {source_file_path} to gs://{bucket_name}/{destination_blob_name}"
+        )
+        data = await asyncio.to_thread(Path(source_file_path).read_bytes)
+        await self._request(
+            "POST",
+            f"{UPLOAD_API}/b/{bucket_name}/o",
+            params={"uploadType": "media", "name": destination_blob_name},
+            headers={"Content-Type": "application/octet-stream"},
+            data=data,
+        )
+        self.logger.info("Upload complete.")
+
+    async def upload_string(
+        self, bucket_name: str, data: str, destination_blob_name: str
+    ):
+        """Uploads in-memory text to the bucket."""
+        self.logger.info(
+            f"Uploading text to gs://{bucket_name}/{destination_blob_name}"
+        )
+        await self._request(
+            "POST",
+            f"{UPLOAD_API}/b/{bucket_name}/o",
+            params={"uploadType": "media", "name": destination_blob_name},
+            headers={"Content-Type": "text/plain; charset=utf-8"},
+            data=data.encode(),
+        )
+
+    async def download_string(self, bucket_name: str, blob_name: str) -> str | None:
+        """Downloads a blob as text; returns None if it does not exist."""
+        body = await self._request(
+            "GET",
+            _object_url(bucket_name, blob_name),
+            params={"alt": "media"},
+            allow_not_found=True,
+            raw=True,
+        )
+        return None if body is None else body.decode()
+
+    async def delete_blob(self, bucket_name: str, blob_name: str):
+        """Deletes a blob from the bucket."""
+        self.logger.info(f"Deleting gs://{bucket_name}/{blob_name}")
+        response = await self._request(
+            "DELETE", _object_url(bucket_name, blob_name), allow_not_found=True
+        )
+        if response is None:
+            self.logger.warning(f"Blob {blob_name} does not exist.")
+        else:
+            self.logger.info("Deletion complete.")
+
+    async def list_blobs(
+        self, bucket_name: str, prefix: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Lists blobs (object resources) in a bucket."""
+        params = {"prefix": prefix} if prefix else {}
+        blobs: list[dict[str, Any]] = []
+        while True:
+            page = await self._request(
+                "GET", f"{STORAGE_API}/b/{bucket_name}/o", params=params
+            )
+            blobs.extend(page.get("items", []))
+            if not page.get("nextPageToken"):
+                return blobs
+            params = {**params, "pageToken": page["nextPageToken"]}
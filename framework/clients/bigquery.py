@@ -1,5 +1,6 @@
 from google.cloud import bigquery
-from typing import Any
+from datetime import datetime, timezone
+from typing import Any, Iterator
 import logging
 
 
@@ -17,6 +18,17 @@ class BigQueryClient:
         results = query_job.result()  # Waits for job to complete.
         return [dict(row) for row in results]
 
+    def iter_query(
+        self, query: str, job_config=None, page_size: int | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Executes a SQL query and yields rows as dicts, fetching result pages lazily.
+        """
+        self.logger.info(f"Executing query: {query}")
+        query_job = self.client.query(query, job_config=job_config)
+        for row in query_job.result(page_size=page_size):
+            yield dict(row)
+
     def get_table(self, table_id: str):
         """Retrieves table metadata."""
         return self.client.get_table(table_id)
@@ -26,6 +38,24 @@ class BigQueryClient:
         table = self.get_table(table_id)
         return table.num_rows
 
+    def get_table_modified_times(self, dataset_ids: list[str]) -> dict[str, datetime]:
+        """
+        Returns {"dataset.table": last_modified_time} for every table in the datasets.
+        Uses one UNION ALL query over the __TABLES__ meta-tables, which (unlike
+        INFORMATION_SCHEMA.TABLES) expose an up-to-date last_modified_time.
+        """
+        query = "\nUNION ALL\n".join(
+            f"SELECT dataset_id, table_id, last_modified_time "
+            f"FROM `{self.project_id}.{dataset_id}.__TABLES__`"
+            for dataset_id in dataset_ids
+        )
+        return {
+            f"{row['dataset_id']}.{row['table_id']}": datetime.fromtimestamp(
+                row["last_modified_time"] / 1000, tz=timezone.utc
+            )
+            for row in self.execute_query(query)
+        }
+
     def check_table_exists(self, table_id: str) -> bool:
         """Checks if a table exists."""
         from google.cloud.exceptions import NotFound
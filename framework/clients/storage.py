@@ -18,6 +18,24 @@ class StorageClient:
         blob.upload_from_filename(source_file_path)
         self.logger.info("Upload complete.")
 
+    def upload_string(self, bucket_name: str, data: str, destination_blob_name: str):
+        """Uploads in-memory text to the bucket."""
+        self.logger.info(
+            f"Uploading text to gs://{bucket_name}/{destination_blob_name}"
+        )
+        bucket = self.client.bucket(bucket_name)
+        bucket.blob(destination_blob_name).upload_from_string(data)
+
+    def download_string(self, bucket_name: str, blob_name: str) -> str | None:
+        """Downloads a blob as text; returns None if it does not exist."""
+        from google.cloud.exceptions import NotFound
+
+        bucket = self.client.bucket(bucket_name)
+        try:
+            return bucket.blob(blob_name).download_as_text()
+        except NotFound:
+            return None
+
     def delete_blob(self, bucket_name: str, blob_name: str):
         """Deletes a blob from the bucket."""
         self.logger.info(f"Deleting gs://{bucket_name}/{blob_name}")
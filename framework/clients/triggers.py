@@ -1,6 +1,10 @@
 import logging
+import time
 from typing import Any
 
+# Re-fetch the IAP ID token this many seconds before it expires (tokens last 1h)
+ID_TOKEN_REFRESH_MARGIN = 300
+
 class DataflowTrigger:
     def __init__(self, project_id: str, region: str):
         self.project_id = project_id
@@ -59,17 +63,52 @@ class ComposerTrigger:
         self.webserver_url = webserver_url.rstrip("/")
         self.logger = logging.getLogger(__name__)
         self._id_token = None
+        self._id_token_expiry = 0.0
 
-    def _get_id_token(self):
-        if self._id_token:
+    def _get_id_token(self, force_refresh: bool = False):
+        """
+        Returns the cached ID token for the webserver URL (IAP support), fetching a
+        new one when forced or when it expires within ID_TOKEN_REFRESH_MARGIN seconds.
+        """
+        if (
+            self._id_token
+            and not force_refresh
+            and time.time() < self._id_token_expiry - ID_TOKEN_REFRESH_MARGIN
+        ):
             return self._id_token
-        
+
+        from google.auth import jwt
         from google.auth.transport.requests import Request
         from google.oauth2 import id_token
         auth_req = Request()
         self._id_token = id_token.fetch_id_token(auth_req, self.webserver_url)
+        self._id_token_expiry = jwt.decode(self._id_token, verify=False)["exp"]
         return self._id_token
 
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        headers: dict[str, str] | None = None,
+        **kwargs,
+    ):
+        """
+        Sends a request with the cached ID token; on 401 fetches a fresh token and
+        retries once, so long polls survive token expiry or revocation.
+        """
+        import requests
+
+        for force_refresh in (False, True):
+            token = self._get_id_token(force_refresh=force_refresh)
+            request_headers = {"Authorization": f"Bearer {token}", **(headers or {})}
+            response = requests.request(
+                method, endpoint, headers=request_headers, **kwargs
+            )
+            if response.status_code != 401:
+                break
+            self.logger.info("ID token rejected (401); fetching a new one")
+        return response
+
     def trigger_job(self, dag_id: str, conf: dict[str, Any] | None = None):
         """
         Triggers a DAG run using the Airflow Stable REST API.
@@ -105,15 +144,75 @@ class ComposerTrigger:
         """
         Polls status of a DAG run.
         """
-        import requests
-
-        token = self._get_id_token()
-        
-        headers = {"Authorization": f"Bearer {token}"}
         endpoint = f"{self.webserver_url}/api/v1/dags/{dag_id}/dagRuns/{dag_run_id}"
         
-        response = requests.get(endpoint, headers=headers)
+        response = self._request("GET", endpoint)
         if response.status_code != 200:
-             raise RuntimeError(f"Failed to get status: {response.status_code} - {response.text}")
-             
+            raise RuntimeError(
+                f"Failed to get status: {response.status_code} - {response.text}"
+            )
+
+        return response.json()
+
+    def get_dag_source_hash(self, dag_id: str) -> str:
+        """
+        Returns a SHA-256 of the DAG file source, usable as a content-based DAG version.
+        """
+        import hashlib
+
+        response = self._request("GET", f"{self.webserver_url}/api/v1/dags/{dag_id}")
+        if response.status_code != 200:
+            raise RuntimeError(
+                f"Failed to get DAG: {response.status_code} - {response.text}"
+            )
+
+        file_token = response.json()["file_token"]
+        response = self._request(
+            "GET",
+            f"{self.webserver_url}/api/v1/dagSources/{file_token}",
+            headers={"Accept": "text/plain"},
+        )
+        if response.status_code != 200:
+            raise RuntimeError(
+                f"Failed to get DAG source: {response.status_code} - {response.text}"
+            )
+
+        return hashlib.sha256(response.content).hexdigest()
+
+    def get_task_instances(self, dag_id: str, dag_run_id: str) -> list[dict[str, Any]]:
+        """
+        Lists task instances (task_id, state, start_date, end_date, ...) of a DAG run.
+        """
+        endpoint = f"{self.webserver_url}/api/v1/dags/{dag_id}/dagRuns/{dag_run_id}/taskInstances"
+
+        task_instances: list[dict[str, Any]] = []
+        while True:
+            params = {"limit": 100, "offset": len(task_instances)}
+            response = self._request("GET", endpoint, params=params)
+            if response.status_code != 200:
+                raise RuntimeError(
+                    f"Failed to get task instances: {response.status_code} - {response.text}"
+                )
+
+            page = response.json()
+            task_instances.extend(page["task_instances"])
+            if (
+                not page["task_instances"]
+                or len(task_instances) >= page["total_entries"]
+            ):
+                return task_instances
+
+    def set_dag_run_state(self, dag_id: str, dag_run_id: str, state: str = "failed"):
+        """
+        Sets the state of a DAG run (e.g. marks it failed to abort it early).
+        """
+        endpoint = f"{self.webserver_url}/api/v1/dags/{dag_id}/dagRuns/{dag_run_id}"
+
+        self.logger.info(f"Setting DAG run {dag_id}/{dag_run_id} state to {state}")
+        response = self._request("PATCH", endpoint, json={"state": state})
+        if response.status_code != 200:
+            raise RuntimeError(
+                f"Failed to set DAG run state: {response.status_code} - {response.text}"
+            )
+
         return response.json()
@@ -1,6 +1,12 @@
 import logging
+import warnings
 import allure
+from datetime import datetime, timedelta, timezone
+from typing import Iterable
 from ..clients.bigquery import BigQueryClient
+from .compare import compare_rows
+from .profiling import BaselineStore, GcsBaselineStore, detect_drift, profile_table
+from .schema import SchemaCatalog
 
 logger = logging.getLogger(__name__)
 
@@ -75,7 +81,7 @@ def assert_schema_contains_columns(
         missing = [col for col in required_columns if col not in actual_columns]
 
         if missing:
-             allure.attach(
+            allure.attach(
                 str(missing),
                 name="Missing Columns",
                 attachment_type=allure.attachment_type.TEXT,
@@ -87,24 +93,178 @@ def assert_schema_contains_columns(
         )
 
 
-def assert_sql_result(bq_client: BigQueryClient, query: str, expected_rows: list[dict] | None = None):
+def assert_schema_lineage(
+    catalog: SchemaCatalog,
+    upstream: tuple[str, str],
+    downstream: tuple[str, str],
+    allow_extra: bool = True,
+    check_modes: bool = True,
+):
+    """
+    Asserts that every upstream column (including nested fields) exists downstream
+    with the same type and, optionally, the same mode.
+    `upstream` / `downstream` are (layer, table) pairs from a preloaded SchemaCatalog.
+    """
+    left, right = f"{upstream[0]}.{upstream[1]}", f"{downstream[0]}.{downstream[1]}"
+    with allure.step(f"Assert schema lineage {left} -> {right}"):
+        diff = catalog.diff(*upstream, *downstream)
+        ignored = set() if check_modes else {"mode"}
+        if allow_extra:
+            ignored.add("extra")
+        drifts = [d for d in diff.drifts if d.kind not in ignored]
+
+        allure.attach(
+            diff.summary(),
+            name="Schema Diff",
+            attachment_type=allure.attachment_type.TEXT,
+        )
+
+        assert not drifts, f"Schema drift from {left} to {right}: " + "; ".join(
+            str(d) for d in drifts
+        )
+        logger.info(
+            f"Assertion passed: Schema lineage {left} -> {right} is consistent."
+        )
+
+
+def assert_no_profile_drift(
+    bq_client: BigQueryClient,
+    table_id: str,
+    store: BaselineStore | GcsBaselineStore,
+    baseline_name: str,
+    update_baseline: bool = False,
+    **drift_options,
+):
+    """
+    Profiles a table in one scan and asserts it has not drifted from its stored
+    baseline. The first run (or `update_baseline=True`) records the baseline instead
+    and emits a warning, since nothing was compared.
+    `drift_options` are passed through to `detect_drift`.
+    """
+    with allure.step(f"Assert no profile drift for {table_id}"):
+        current = profile_table(bq_client, table_id)
+        baseline = None if update_baseline else store.load(baseline_name)
+
+        if baseline is None:
+            store.save(baseline_name, current)
+            reason = "re-recorded" if update_baseline else "no baseline found, recorded"
+            message = (
+                f"Profile drift not checked for {table_id}: {reason} "
+                f"baseline {baseline_name} for env {store.env}."
+            )
+            allure.attach(
+                message,
+                name="Profile Baseline",
+                attachment_type=allure.attachment_type.TEXT,
+            )
+            logger.warning(message)
+            warnings.warn(message, UserWarning, stacklevel=2)
+            return
+
+        drifts = detect_drift(baseline, current, **drift_options)
+        if drifts:
+            allure.attach(
+                "\n".join(str(d) for d in drifts),
+                name="Profile Drift",
+                attachment_type=allure.attachment_type.TEXT,
+            )
+
+        assert not drifts, f"Profile drift in {table_id}: " + "; ".join(
+            str(d) for d in drifts
+        )
+        logger.info(f"Assertion passed: No profile drift for {table_id}.")
+
+
+def assert_sql_result(
+    bq_client: BigQueryClient,
+    query: str,
+    expected_rows: Iterable[dict] | None = None,
+    mode: str = "ordered",
+    key: str | list[str] | None = None,
+    tolerances: dict[str, float] | None = None,
+    max_diff_rows: int = 20,
+):
     """
     Simpler assertion: Runs query and checks if it returns results (or matches expected).
-    If expected_rows is provided, checks exact equality (order sensitive).
+    If expected_rows is provided, compares them with the streamed query results:
+    mode "ordered" (order sensitive), "multiset" (order insensitive) or "keyed"
+    (matched on `key`, with optional per-column numeric `tolerances`).
     If expected_rows is None, just asserts that rows > 0.
+    Failures report counts plus the first `max_diff_rows` mismatches only.
     """
     with allure.step("Assert SQL Query Result"):
         allure.attach(query, name="Query", attachment_type=allure.attachment_type.TEXT)
         logger.info(f"Running query: {query}")
-        
-        rows = bq_client.execute_query(query)
-        logger.info(f"Query returned {len(rows)} rows.")
-        
-        if expected_rows is not None:
-            assert rows == expected_rows, f"Expected {expected_rows}, got {rows}"
-        else:
-            assert len(rows) > 0, "Query returned no rows"
-            
+
+        rows = bq_client.iter_query(query)
+
+        if expected_rows is None:
+            assert next(rows, None) is not None, "Query returned no rows"
+            logger.info("Assertion passed.")
+            return
+
+        result = compare_rows(
+            rows,
+            expected_rows,
+            mode=mode,
+            key=key,
+            tolerances=tolerances,
+            max_mismatches=max_diff_rows,
+        )
+        logger.info(f"Query returned {result.actual_count} rows.")
+        if not result.ok:
+            allure.attach(
+                result.summary(),
+                name="Result Diff",
+                attachment_type=allure.attachment_type.TEXT,
+            )
+
+        assert result.ok, result.summary()
+        logger.info("Assertion passed.")
+
+
+def assert_query_results_match(
+    bq_client: BigQueryClient,
+    actual_query: str,
+    expected_query: str,
+    mode: str = "multiset",
+    key: str | list[str] | None = None,
+    tolerances: dict[str, float] | None = None,
+    max_diff_rows: int = 20,
+):
+    """
+    Compares the results of two queries (e.g. source vs target layer) with both
+    sides streamed. See `assert_sql_result` for the comparison modes.
+    """
+    with allure.step("Assert Query Results Match"):
+        allure.attach(
+            actual_query,
+            name="Actual Query",
+            attachment_type=allure.attachment_type.TEXT,
+        )
+        allure.attach(
+            expected_query,
+            name="Expected Query",
+            attachment_type=allure.attachment_type.TEXT,
+        )
+
+        result = compare_rows(
+            bq_client.iter_query(actual_query),
+            bq_client.iter_query(expected_query),
+            mode=mode,
+            key=key,
+            tolerances=tolerances,
+            max_mismatches=max_diff_rows,
+            # Keyed reports re-run the expected query for the mismatching rows
+            reread_expected=lambda: bq_client.iter_query(expected_query),
+        )
+        allure.attach(
+            result.summary(),
+            name="Result Diff",
+            attachment_type=allure.attachment_type.TEXT,
+        )
+
+        assert result.ok, result.summary()
         logger.info("Assertion passed.")
 
 def assert_data_integrity(bq_client: BigQueryClient, query: str, check_func):
@@ -126,7 +286,7 @@ def assert_data_integrity(bq_client: BigQueryClient, query: str, check_func):
             raise e
 
 
-// validators/null_checks.py
+# validators/null_checks.py
 def assert_no_nulls(bq, table, column):
     sql = f"""
     SELECT COUNT(*) cnt
@@ -136,7 +296,7 @@ def assert_no_nulls(bq, table, column):
     cnt = list(bq.query(sql))[0].cnt
     assert cnt == 0, f"Found {cnt} NULLs in {column}"
 
-    // validators/referential_integrity.py
+# validators/referential_integrity.py
 def assert_sat_has_hub_keys(bq, hub, satellite, key):
     sql = f"""
     SELECT COUNT(*) cnt
@@ -149,7 +309,7 @@ def assert_sat_has_hub_keys(bq, hub, satellite, key):
     assert cnt == 0, f"Satellite has {cnt} orphan records"
 
 
-//validators/freshness.py
+# validators/freshness.py
 def assert_fresh_data(bq, table, ts_column, hours=24):
     sql = f"""
     SELECT COUNT(*) cnt
@@ -160,11 +320,11 @@ def assert_fresh_data(bq, table, ts_column, hours=24):
     assert cnt == 0, "Stale data detected"
 
 
-//Topic has data
+# Topic has data
 def assert_topic_not_empty(messages):
     assert len(messages) > 0, "Kafka topic is empty"
 
-//Required fields exist
+# Required fields exist
 def assert_required_fields(messages, required_fields):
     for i, msg in enumerate(messages):
         missing = [f for f in required_fields if f not in msg]
@@ -172,9 +332,7 @@ def assert_required_fields(messages, required_fields):
             f"Message {i} missing fields: {missing}"
         )
 
-//Timestamp freshness
-from datetime import datetime, timezone, timedelta
-
+# Timestamp freshness
 def assert_event_freshness(
     messages,
     ts_field,
@@ -193,11 +351,11 @@ def assert_event_freshness(
     )
 
 
-    //Optional: Business key uniqueness (sample window)
+# Optional: Business key uniqueness (sample window)
 def assert_unique_keys(messages, key):
     values = [msg[key] for msg in messages]
     duplicates = set(v for v in values if values.count(v) > 1)
 
     assert not duplicates, (
         f"Duplicate keys found in Kafka messages: {duplicates}"
-    )
\ No newline at end of file
+    )
@@ -0,0 +1,171 @@
+import json
+import logging
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+
+from ..clients.storage import StorageClient
+from ..clients.triggers import ComposerTrigger
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_DAG_STATES = {"success", "failed"}
+
+
+@dataclass
+class LayerTiming:
+    layer: str
+    task_id: str
+    seconds: float  # task runtime
+    latency_seconds: float  # trigger -> task end
+    rows_per_second: float | None  # None when the task took no measurable time
+
+
+@dataclass
+class BenchmarkResult:
+    env: str
+    load_type: str
+    rows: int
+    shards: int
+    seed_seconds: float
+    end_to_end_seconds: float  # trigger -> last layer task end
+    dag_state: str
+    layers: list[LayerTiming] = field(default_factory=list)
+    dag_run_id: str | None = None
+    recorded_at: str = ""
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def _parse_ts(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value else None
+
+
+def wait_for_dag_run(
+    composer_trigger: ComposerTrigger,
+    dag_id: str,
+    dag_run_id: str,
+    poll_interval: float = 30,
+    timeout: float = 6 * 3600,
+) -> str:
+    """Polls a DAG run until it reaches a terminal state; returns that state."""
+    start = time.monotonic()
+    while True:
+        state = composer_trigger.get_status(dag_id, dag_run_id).get("state")
+        if state in TERMINAL_DAG_STATES:
+            return state
+        if time.monotonic() - start > timeout:
+            raise TimeoutError(f"DAG run {dag_run_id} still {state} after {timeout}s")
+        time.sleep(poll_interval)
+
+
+def layer_timings(
+    task_instances: list[dict],
+    layer_tasks: dict[str, str],
+    triggered_at: datetime,
+    rows: int,
+) -> list[LayerTiming]:
+    """
+    Derives per-layer runtime, latency from trigger and throughput (rows/s of
+    task runtime) from Airflow task instances. `layer_tasks` maps layer -> task_id.
+    """
+    by_task = {ti["task_id"]: ti for ti in task_instances}
+    timings = []
+    for layer, task_id in layer_tasks.items():
+        ti = by_task.get(task_id)
+        start, end = _parse_ts(ti and ti.get("start_date")), _parse_ts(
+            ti and ti.get("end_date")
+        )
+        if start is None or end is None:
+            logger.warning(f"Task {task_id} for layer {layer} has no start/end date")
+            continue
+        seconds = (end - start).total_seconds()
+        timings.append(
+            LayerTiming(
+                layer=layer,
+                task_id=task_id,
+                seconds=seconds,
+                latency_seconds=(end - triggered_at).total_seconds(),
+                rows_per_second=rows / seconds if seconds > 0 else None,
+            )
+        )
+    return timings
+
+
+def _stamp(result: BenchmarkResult):
+    result.recorded_at = result.recorded_at or datetime.now(timezone.utc).isoformat()
+
+
+class BenchmarkRecorder:
+    """Appends results to {root}/{env}/benchmarks.jsonl so runs build scaling curves."""
+
+    def __init__(self, env: str, root: str | Path = "benchmarks"):
+        self.env = env
+        self.path = Path(root) / env / "benchmarks.jsonl"
+
+    def record(self, result: BenchmarkResult):
+        _stamp(result)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a") as f:
+            f.write(json.dumps(result.to_dict(), separators=(",", ":")) + "\n")
+        logger.info(
+            f"Recorded benchmark ({result.load_type}, {result.rows} rows) in {self.path}"
+        )
+
+    def load(self) -> list[dict]:
+        if not self.path.exists():
+            return []
+        with open(self.path, "r") as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+
+class GcsBenchmarkRecorder:
+    """
+    Stores each result as its own object under gs://{bucket}/{prefix}/{env}/,
+    named by recording time, so scaling curves outlive CI checkouts (fresh
+    runners) and concurrent runs never overwrite each other's records.
+    """
+
+    def __init__(
+        self,
+        storage_client: StorageClient,
+        bucket: str,
+        env: str,
+        prefix: str = "benchmarks",
+    ):
+        self.storage_client = storage_client
+        self.bucket = bucket
+        self.env = env
+        self.prefix = prefix.rstrip("/")
+
+    def _folder(self) -> str:
+        return f"{self.prefix}/{self.env}/"
+
+    def record(self, result: BenchmarkResult):
+        _stamp(result)
+        stamp = result.recorded_at.replace(":", "")
+        blob = f"{self._folder()}{stamp}-{result.load_type.lower()}-{result.rows}.json"
+        self.storage_client.upload_string(
+            self.bucket, json.dumps(result.to_dict(), separators=(",", ":")), blob
+        )
+        uri = f"gs://{self.bucket}/{blob}"
+        logger.info(
+            f"Recorded benchmark ({result.load_type}, {result.rows} rows) in {uri}"
+        )
+
+    def load(self) -> list[dict]:
+        """All results for the env, oldest first."""
+        names = sorted(
+            blob.name
+            for blob in self.storage_client.list_blobs(
+                self.bucket, prefix=self._folder()
+            )
+        )
+        results = []
+        for name in names:
+            data = self.storage_client.download_string(self.bucket, name)
+            if data:
+                results.append(json.loads(data))
+        return results
@@ -0,0 +1,410 @@
+import hashlib
+import json
+import logging
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from decimal import Decimal
+from itertools import zip_longest
+from typing import Any, Callable, Iterable
+
+logger = logging.getLogger(__name__)
+
+MODES = ("ordered", "multiset", "keyed")
+_MAX_ROW_REPR = 500
+# Multiset mode keeps sample rows for at most this many unbalanced digests
+_MIN_SAMPLE_POOL = 1_000
+# Every NaN (float, Decimal, signed or signaling) canonicalizes to this one value
+_NAN = Decimal("NaN")
+
+
+class _Hashed:
+    """Stands in for an expected value keyed mode only kept the hash of."""
+
+    def __repr__(self) -> str:
+        return "<hashed>"
+
+
+_HASHED = _Hashed()
+
+
+def _show(row: dict[str, Any], column: str) -> str:
+    return repr(row[column]) if column in row else "<missing>"
+
+
+@dataclass
+class RowMismatch:
+    kind: str  # "missing" (expected only), "unexpected" (actual only) or "different"
+    location: Any  # row position (ordered) or key tuple (keyed); None for multiset
+    # Keyed mode re-reads reported expected rows when it can; otherwise values
+    # it only kept the hash of show as <hashed>
+    expected: dict[str, Any] | None = None
+    actual: dict[str, Any] | None = None
+    columns: list[str] = field(default_factory=list)  # differing columns
+
+    def __str__(self) -> str:
+        where = f" at {self.location}" if self.location is not None else ""
+        if self.kind == "different":
+            diffs = ", ".join(
+                f"{c}: {_show(self.actual, c)} != {_show(self.expected, c)}"
+                for c in self.columns
+            )
+            text = f"different{where}: {diffs}"
+        else:
+            text = f"{self.kind}{where}: {self.expected if self.kind == 'missing' else self.actual}"
+        return text if len(text) <= _MAX_ROW_REPR else text[:_MAX_ROW_REPR] + "..."
+
+
+@dataclass
+class ComparisonResult:
+    """Counts for the whole comparison plus at most `max_mismatches` examples."""
+
+    mode: str
+    max_mismatches: int = 20
+    actual_count: int = 0
+    expected_count: int = 0
+    matched: int = 0
+    missing: int = 0
+    unexpected: int = 0
+    different: int = 0
+    mismatches: list[RowMismatch] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not (self.missing or self.unexpected or self.different)
+
+    def record(self, mismatch: RowMismatch, count: int = 1):
+        setattr(self, mismatch.kind, getattr(self, mismatch.kind) + count)
+        if len(self.mismatches) < self.max_mismatches:
+            self.mismatches.append(mismatch)
+
+    def summary(self) -> str:
+        lines = [
+            f"Result comparison ({self.mode}): {self.actual_count} actual rows, "
+            f"{self.expected_count} expected rows, {self.matched} matched",
+        ]
+        if self.ok:
+            return lines[0]
+        lines.append(
+            f"  missing: {self.missing}, unexpected: {self.unexpected}, "
+            f"different: {self.different}"
+        )
+        lines.append(f"  First {len(self.mismatches)} mismatches:")
+        lines.extend(f"    {m}" for m in self.mismatches)
+        return "\n".join(lines)
+
+
+def _canonical_decimal(number: Decimal) -> int | Decimal:
+    # Decimal.normalize() rounds to the context precision (28 digits), which
+    # would merge distinct BIGNUMERIC values; drop trailing zeros exactly instead
+    sign, digits, exponent = number.as_tuple()
+    if digits == (0,):
+        return 0
+    end = len(digits)
+    while digits[end - 1] == 0:
+        end -= 1
+    exponent += len(digits) - end
+    if exponent >= 0:
+        return int(number)
+    return Decimal((sign, digits[:end], exponent))
+
+
+def _canonical(value: Any) -> Any:
+    """
+    Maps equal numbers (1, 1.0, Decimal('1.00')) to one exact, hashable value:
+    an int when integral, else a Decimal without trailing zeros. Floats go
+    through repr() so 0.3 stays 0.3, and Decimals are never rounded. NaN maps
+    to a single Decimal so every mode treats NaN as equal to NaN only.
+    """
+    if isinstance(value, (str, bool, int)) or value is None:
+        return value
+    if isinstance(value, float):
+        if value.is_integer():
+            return int(value)
+        value = Decimal(repr(value))
+    if isinstance(value, Decimal):
+        if value.is_nan():
+            return _NAN
+        return _canonical_decimal(value) if value.is_finite() else value
+    if isinstance(value, dict):
+        return {k: _canonical(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    return value
+
+
+def _json_default(value: Any) -> Any:
+    # Tag decimals so Decimal("0.5") and the string "0.5" hash differently
+    if isinstance(value, Decimal):
+        return {"$decimal": str(value)}
+    return str(value)
+
+
+def row_digest(row: dict[str, Any]) -> bytes:
+    """Order-independent (by column) 16-byte digest of a row."""
+    encoded = json.dumps(_canonical(row), sort_keys=True, default=_json_default)
+    return hashlib.blake2b(encoded.encode(), digest_size=16).digest()
+
+
+def _value_hash(value: Any) -> bytes:
+    value = _canonical(value)
+    if isinstance(value, (dict, list)):
+        encoded = json.dumps(value, sort_keys=True, default=_json_default)
+    else:
+        encoded = repr(value)  # keeps types apart: 1, '1', Decimal('1.5')
+    return hashlib.blake2b(encoded.encode(), digest_size=8).digest()
+
+
+def _is_finite_number(value: Any) -> bool:
+    if isinstance(value, Decimal):
+        return value.is_finite()
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _values_equal(actual: Any, expected: Any, tolerance: float | None) -> bool:
+    actual, expected = _canonical(actual), _canonical(expected)
+    if actual is _NAN or expected is _NAN:
+        # NaN equals NaN only, as in the multiset digests and keyed hashes
+        return actual is expected
+    if (
+        tolerance is not None
+        and _is_finite_number(actual)
+        and _is_finite_number(expected)
+    ):
+        return abs(actual - expected) <= Decimal(repr(tolerance))
+    # Infinities (and everything else) compare exactly
+    return actual == expected
+
+
+def _differing_columns(
+    actual: dict[str, Any], expected: dict[str, Any], tolerances: dict[str, float]
+) -> list[str]:
+    columns = list(expected) + [c for c in actual if c not in expected]
+    return [
+        c
+        for c in columns
+        if c not in actual
+        or c not in expected
+        or not _values_equal(actual[c], expected[c], tolerances.get(c))
+    ]
+
+
+def _compare_ordered(actual, expected, tolerances, result):
+    sentinel = object()
+    for position, (a, e) in enumerate(
+        zip_longest(actual, expected, fillvalue=sentinel)
+    ):
+        if a is sentinel:
+            result.expected_count += 1
+            result.record(RowMismatch("missing", position, expected=e))
+        elif e is sentinel:
+            result.actual_count += 1
+            result.record(RowMismatch("unexpected", position, actual=a))
+        else:
+            result.actual_count += 1
+            result.expected_count += 1
+            columns = _differing_columns(a, e, tolerances)
+            if columns:
+                result.record(RowMismatch("different", position, e, a, columns))
+            else:
+                result.matched += 1
+
+
+def _compare_multiset(actual, expected, result):
+    # Net count per row digest (+actual, -expected). Sides are consumed in lock
+    # step so matching rows cancel early. Sample rows are kept for a bounded
+    # number of unbalanced digests only; the rest are reported by digest.
+    balance: dict[bytes, int] = {}
+    samples: dict[bytes, dict[str, Any]] = {}
+    sample_pool = max(result.max_mismatches, _MIN_SAMPLE_POOL)
+
+    def consume(row, delta):
+        digest = row_digest(row)
+        previous = balance.get(digest, 0)
+        count = previous + delta
+        if abs(count) < abs(previous):
+            result.matched += 1
+        if count == 0:
+            del balance[digest]
+            samples.pop(digest, None)
+        else:
+            balance[digest] = count
+            if digest not in samples and len(samples) < sample_pool:
+                samples[digest] = row
+
+    sentinel = object()
+    for a, e in zip_longest(actual, expected, fillvalue=sentinel):
+        if a is not sentinel:
+            result.actual_count += 1
+            consume(a, 1)
+        if e is not sentinel:
+            result.expected_count += 1
+            consume(e, -1)
+
+    # Digests with a sample row first, so the reported examples show rows
+    unbalanced = sorted(balance.items(), key=lambda item: item[0] not in samples)
+    for digest, count in unbalanced:
+        row = samples.get(digest, {"_row_digest": digest.hex()})
+        if count > 0:
+            result.record(RowMismatch("unexpected", None, actual=row), count)
+        else:
+            result.record(RowMismatch("missing", None, expected=row), -count)
+
+
+def _exact_hashes(row, columns, tolerances) -> bytes:
+    return b"".join(_value_hash(row[c]) for c in columns if c not in tolerances)
+
+
+def _fingerprint(row, key, tolerances, layouts):
+    """
+    Compact stand-in for an expected row: its key values, column layout (one
+    shared tuple per layout), 8-byte hashes of the exact columns and the values
+    of tolerance columns.
+    """
+    columns = tuple(row)
+    columns = layouts.setdefault(columns, columns)
+    approx = tuple(row[c] for c in columns if c in tolerances)
+    return (
+        tuple(row.get(c) for c in key),
+        columns,
+        _exact_hashes(row, columns, tolerances),
+        approx,
+    )
+
+
+def _fingerprint_diff(actual, fingerprint, tolerances):
+    """Returns (differing columns, known expected values) for an actual row."""
+    _, columns, hashes, approx = fingerprint
+    expected_values = dict(zip([c for c in columns if c in tolerances], approx))
+    if (
+        tuple(actual) == columns
+        and _exact_hashes(actual, columns, tolerances) == hashes
+        and all(
+            _values_equal(actual[c], v, tolerances[c])
+            for c, v in expected_values.items()
+        )
+    ):
+        return [], expected_values
+
+    exact = [c for c in columns if c not in tolerances]
+    expected_hashes = {c: hashes[i * 8 : i * 8 + 8] for i, c in enumerate(exact)}
+    differing = []
+    for c in list(columns) + [c for c in actual if c not in columns]:
+        if c not in actual or c not in columns:
+            differing.append(c)
+        elif c in expected_values:
+            if not _values_equal(actual[c], expected_values[c], tolerances[c]):
+                differing.append(c)
+        elif _value_hash(actual[c]) != expected_hashes[c]:
+            differing.append(c)
+    return differing, expected_values
+
+
+def _compare_keyed(actual, expected, key, tolerances, result, reread_expected):
+    # The expected side is indexed as key -> fingerprint; the actual side is streamed
+    index: dict[tuple, tuple] = {}
+    layouts: dict[tuple, tuple] = {}
+    for e in expected:
+        result.expected_count += 1
+        k = tuple(_canonical(e.get(c)) for c in key)
+        if k in index:
+            raise ValueError(f"Duplicate key {k} in expected rows")
+        index[k] = _fingerprint(e, key, tolerances, layouts)
+
+    for a in actual:
+        result.actual_count += 1
+        location = tuple(a.get(c) for c in key)
+        fingerprint = index.pop(tuple(_canonical(v) for v in location), None)
+        if fingerprint is None:
+            result.record(RowMismatch("unexpected", location, actual=a))
+            continue
+        columns, expected_values = _fingerprint_diff(a, fingerprint, tolerances)
+        if columns:
+            expected_values = {
+                **dict.fromkeys(fingerprint[1], _HASHED),
+                **expected_values,
+                **dict(zip(key, location)),
+            }
+            result.record(
+                RowMismatch("different", location, expected_values, a, columns)
+            )
+        else:
+            result.matched += 1
+
+    for location, *_ in index.values():
+        result.record(
+            RowMismatch("missing", location, expected=dict(zip(key, location)))
+        )
+
+    # Replace the hashed expected side of the reported mismatches with full rows
+    pending = {
+        tuple(_canonical(v) for v in m.location): m
+        for m in result.mismatches
+        if m.kind in ("different", "missing")
+    }
+    if not pending:
+        return
+    if reread_expected is not None:
+        expected = reread_expected()
+    elif not isinstance(expected, Sequence):
+        return  # a one-shot stream cannot be read again
+    for e in expected:
+        if not pending:
+            break
+        mismatch = pending.pop(tuple(_canonical(e.get(c)) for c in key), None)
+        if mismatch is not None:
+            mismatch.expected = e
+
+
+def compare_rows(
+    actual: Iterable[dict[str, Any]],
+    expected: Iterable[dict[str, Any]],
+    mode: str = "ordered",
+    key: str | list[str] | None = None,
+    tolerances: dict[str, float] | None = None,
+    max_mismatches: int = 20,
+    reread_expected: Callable[[], Iterable[dict[str, Any]]] | None = None,
+) -> ComparisonResult:
+    """
+    Compares two row streams in O(n) without materializing them:
+    - "ordered": row by row, by position; constant memory.
+    - "multiset": order-insensitive, via row digests (duplicates count). Holds a
+      16-byte digest and a count per unbalanced row; sample rows are kept for at
+      most max(max_mismatches, 1000) of them, others are reported by digest.
+    - "keyed": rows matched on `key` columns. The expected side is indexed as
+      key -> 8-byte hash per column (tolerance columns keep their value). When
+      there are mismatches, `reread_expected` (or a second pass over a list or
+      tuple `expected`) fetches the full expected rows for the reported ones
+      only; otherwise their hashed values show as <hashed>.
+    `tolerances` maps column -> absolute numeric tolerance (ordered/keyed only).
+    Numbers compare exactly: ints, floats (via repr) and Decimals share one
+    canonical representation. NaN equals NaN and nothing else in every mode;
+    tolerances apply to finite numbers only. Only the first `max_mismatches` mismatching rows
+    are kept for reporting.
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown comparison mode: {mode}. Expected one of {MODES}")
+    if mode == "keyed" and not key:
+        raise ValueError("Keyed comparison requires `key` columns")
+    if mode == "multiset" and tolerances:
+        raise ValueError(
+            "Tolerances need ordered or keyed mode; multiset uses exact hashes"
+        )
+
+    result = ComparisonResult(mode=mode, max_mismatches=max_mismatches)
+    tolerances = tolerances or {}
+
+    if mode == "ordered":
+        _compare_ordered(actual, expected, tolerances, result)
+    elif mode == "multiset":
+        _compare_multiset(actual, expected, result)
+    else:
+        key_columns = [key] if isinstance(key, str) else list(key)
+        _compare_keyed(
+            actual, expected, key_columns, tolerances, result, reread_expected
+        )
+
+    logger.info(
+        f"Compared {result.actual_count} actual vs {result.expected_count} expected rows "
+        f"({mode}): {result.matched} matched"
+    )
+    return result
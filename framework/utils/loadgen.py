@@ -0,0 +1,193 @@
+import logging
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Iterator
+
+import numpy as np
+import pandas as pd
+
+from ..clients.storage import StorageClient
+
+logger = logging.getLogger(__name__)
+
+FIRST_NAMES = np.array(
+    "John Jane Alice Bob Maria Wei Priya Omar Sofia Liam "
+    "Emma Noah Aisha Lucas Yuki Carlos Fatima Ivan Chloe Ravi".split()
+)
+LAST_NAMES = np.array(
+    "Doe Smith Brown Garcia Chen Patel Khan Rossi Muller Kim "
+    "Silva Nguyen Cohen Jones Sato Lopez Ali Petrov Martin Singh".split()
+)
+REGIONS = np.array(["North", "South", "East", "West"])
+
+
+@dataclass
+class CdcMix:
+    """Share of inserts/updates/deletes in a CDC batch, plus late-arriving rows."""
+
+    insert: float = 0.2
+    update: float = 0.7
+    delete: float = 0.1
+    late_arrival: float = 0.05
+    max_lateness_hours: int = 72
+
+    def __post_init__(self):
+        if not np.isclose(self.insert + self.update + self.delete, 1.0):
+            raise ValueError("CDC insert/update/delete shares must sum to 1")
+
+
+def _customers(
+    rng: np.random.Generator, ids: np.ndarray, load_ts: np.datetime64
+) -> pd.DataFrame:
+    """
+    Vectorized customer rows for the given ids, updated within the load day.
+    Columns match tests/data/customer_*.csv; CDC batches add an `op` column (I/U/D).
+    """
+    n = len(ids)
+    first = FIRST_NAMES[rng.integers(0, len(FIRST_NAMES), n)]
+    last = LAST_NAMES[rng.integers(0, len(LAST_NAMES), n)]
+    ids_str = pd.Series(ids).astype(str)
+    first_s, last_s = pd.Series(first), pd.Series(last)
+    offsets = rng.integers(0, 24 * 3600, n).astype("timedelta64[s]")
+    return pd.DataFrame(
+        {
+            "customer_id": ids,
+            "name": first_s + " " + last_s,
+            "email": first_s.str.lower()
+            + "."
+            + last_s.str.lower()
+            + ids_str
+            + "@example.com",
+            "region": REGIONS[rng.integers(0, len(REGIONS), n)],
+            "updated_at": load_ts + offsets,
+        }
+    )
+
+
+def generate_ini(
+    rows: int, start_id: int = 1, load_date: str = "2024-01-01", seed: int = 0
+) -> pd.DataFrame:
+    """Initial load: `rows` new customers with consecutive ids from `start_id`."""
+    rng = np.random.default_rng(seed)
+    ids = np.arange(start_id, start_id + rows, dtype=np.int64)
+    return _customers(rng, ids, np.datetime64(load_date, "s"))
+
+
+def generate_cdc(
+    rows: int,
+    existing_rows: int,
+    next_id: int,
+    load_date: str = "2024-01-02",
+    mix: CdcMix | None = None,
+    seed: int = 0,
+) -> pd.DataFrame:
+    """
+    CDC batch against customers 1..existing_rows: inserts get new ids from
+    `next_id`, updates/deletes hit random existing ids and a share of rows
+    arrive late (updated_at before the load date).
+    """
+    mix = mix or CdcMix()
+    rng = np.random.default_rng(seed)
+    ops = rng.choice(
+        np.array(["I", "U", "D"]), rows, p=[mix.insert, mix.update, mix.delete]
+    )
+
+    ids = rng.integers(1, existing_rows + 1, rows, dtype=np.int64)
+    inserts = ops == "I"
+    ids[inserts] = np.arange(next_id, next_id + inserts.sum(), dtype=np.int64)
+
+    df = _customers(rng, ids, np.datetime64(load_date, "s"))
+    late = rng.random(rows) < mix.late_arrival
+    lateness = rng.integers(1, mix.max_lateness_hours + 1, late.sum()).astype(
+        "timedelta64[h]"
+    )
+    late_ts = df.loc[late, "updated_at"].to_numpy() - np.timedelta64(1, "D") - lateness
+    df.loc[late, "updated_at"] = late_ts
+    df["op"] = ops
+    return df
+
+
+def generate_shards(
+    load_type: str,
+    total_rows: int,
+    shard_rows: int = 1_000_000,
+    existing_rows: int | None = None,
+    mix: CdcMix | None = None,
+    seed: int = 0,
+) -> Iterator[pd.DataFrame]:
+    """
+    Yields the dataset shard by shard so only one shard is in memory at a time.
+    CDC batches update `existing_rows` customers (default: `total_rows`) and
+    insert new ids above them.
+    """
+    existing_rows = existing_rows or total_rows
+    next_id = existing_rows + 1
+    for index, start in enumerate(range(0, total_rows, shard_rows)):
+        rows = min(shard_rows, total_rows - start)
+        if load_type == "INI":
+            shard = generate_ini(rows, start_id=start + 1, seed=seed + index)
+        elif load_type == "CDC":
+            shard = generate_cdc(
+                rows, existing_rows, next_id, mix=mix, seed=seed + index
+            )
+            next_id += int((shard["op"] == "I").sum())
+        else:
+            raise ValueError(f"Unknown load type: {load_type}")
+        yield shard
+
+
+@dataclass
+class SeedResult:
+    blobs: list[str]
+    rows: int
+    bytes: int
+    seconds: float
+
+
+def upload_shards(
+    storage_client: StorageClient,
+    bucket: str,
+    prefix: str,
+    shards: Iterator[pd.DataFrame],
+    max_workers: int = 4,
+) -> SeedResult:
+    """
+    Writes each shard to a temporary CSV and uploads it as {prefix}-NNNNN.csv.
+    Generation overlaps with up to `max_workers` uploads; at most that many
+    shards are pending at once, which bounds memory and disk use.
+    """
+    start = time.monotonic()
+    blobs: list[str] = []
+    total_rows = total_bytes = 0
+
+    def upload(path: str, blob_name: str) -> int:
+        try:
+            storage_client.upload_file(bucket, path, blob_name)
+            return os.path.getsize(path)
+        finally:
+            os.remove(path)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        pending = []
+        for index, shard in enumerate(shards):
+            fd, path = tempfile.mkstemp(suffix=".csv")
+            os.close(fd)
+            shard.to_csv(path, index=False)
+            blob_name = f"{prefix}-{index:05d}.csv"
+            blobs.append(blob_name)
+            total_rows += len(shard)
+            pending.append(pool.submit(upload, path, blob_name))
+            if len(pending) >= max_workers:
+                total_bytes += pending.pop(0).result()
+        for future in pending:
+            total_bytes += future.result()
+
+    seconds = time.monotonic() - start
+    logger.info(
+        f"Seeded {total_rows} rows in {len(blobs)} shards "
+        f"({total_bytes / 1e6:.1f} MB) to gs://{bucket}/{prefix}-* in {seconds:.1f}s"
+    )
+    return SeedResult(blobs=blobs, rows=total_rows, bytes=total_bytes, seconds=seconds)
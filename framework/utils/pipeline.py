@@ -0,0 +1,158 @@
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Callable
+
+from ..clients.bigquery import BigQueryClient
+from ..clients.triggers import ComposerTrigger
+
+logger = logging.getLogger(__name__)
+
+FAILED_TASK_STATES = {"failed", "upstream_failed"}
+
+
+@dataclass
+class LayerValidation:
+    """
+    Checks for one pipeline layer plus the signals that say the layer has landed:
+    the Airflow `task_ids` that build it and/or its `tables` ("dataset.table").
+    """
+
+    name: str
+    check: Callable[[], None]
+    task_ids: list[str] = field(default_factory=list)
+    tables: list[str] = field(default_factory=list)
+
+
+class PipelinedValidator:
+    """
+    Validates each layer as soon as it is ready while the DAG keeps running later
+    layers. Readiness comes from Airflow task-instance states (`readiness="tasks"`)
+    or from table modification times (`readiness="tables"`), polled once per
+    `poll_interval`. Layers are validated in the given order; a failed check, a
+    failed task or a timeout marks the DAG run failed and raises.
+    """
+
+    def __init__(
+        self,
+        composer_trigger: ComposerTrigger,
+        bq_client: BigQueryClient,
+        dag_id: str,
+        dag_run_id: str,
+        layers: list[LayerValidation],
+        readiness: str = "tasks",
+        poll_interval: float = 30,
+        timeout: float = 3600,
+        triggered_at: datetime | None = None,
+        abort_on_failure: bool = True,
+    ):
+        if readiness not in ("tasks", "tables"):
+            raise ValueError(f"Unknown readiness source: {readiness}")
+        self.composer_trigger = composer_trigger
+        self.bq_client = bq_client
+        self.dag_id = dag_id
+        self.dag_run_id = dag_run_id
+        self.layers = layers
+        self.readiness = readiness
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.triggered_at = triggered_at or datetime.now(timezone.utc)
+        self.abort_on_failure = abort_on_failure
+
+    def run(self) -> dict[str, float]:
+        """
+        Polls until every layer is validated.
+        Returns {layer name: seconds from start until its checks passed}.
+        """
+        start = time.monotonic()
+        pending = list(self.layers)
+        timings: dict[str, float] = {}
+
+        while True:
+            ready = self._ready_layers(pending)
+
+            # Keep layer order: a layer is only validated once all upstream ones are
+            while pending and pending[0].name in ready:
+                layer = pending.pop(0)
+                logger.info(f"Layer {layer.name} is ready, validating")
+                try:
+                    layer.check()
+                except Exception as e:
+                    self._abort(f"validation of {layer.name} failed: {e}")
+                    raise
+                timings[layer.name] = time.monotonic() - start
+                logger.info(
+                    f"Layer {layer.name} validated after {timings[layer.name]:.0f}s"
+                )
+
+            if not pending:
+                return timings
+
+            if time.monotonic() - start > self.timeout:
+                message = (
+                    f"Timed out after {self.timeout}s waiting for layers "
+                    f"{[layer.name for layer in pending]}"
+                )
+                self._abort(message)
+                raise TimeoutError(message)
+
+            time.sleep(self.poll_interval)
+
+    def _ready_layers(self, pending: list[LayerValidation]) -> set[str]:
+        if self.readiness == "tasks":
+            return self._ready_by_tasks(pending)
+        return self._ready_by_tables(pending)
+
+    def _ready_by_tasks(self, pending: list[LayerValidation]) -> set[str]:
+        """One task-instances call per poll; raises if a layer task failed."""
+        states = {
+            ti["task_id"]: ti["state"]
+            for ti in self.composer_trigger.get_task_instances(
+                self.dag_id, self.dag_run_id
+            )
+        }
+        failed = {
+            task_id: states[task_id]
+            for layer in pending
+            for task_id in layer.task_ids
+            if states.get(task_id) in FAILED_TASK_STATES
+        }
+        if failed:
+            message = f"DAG {self.dag_id} run {self.dag_run_id} tasks failed: {failed}"
+            self._abort(message)
+            raise RuntimeError(message)
+
+        return {
+            layer.name
+            for layer in pending
+            if all(states.get(task_id) == "success" for task_id in layer.task_ids)
+        }
+
+    def _ready_by_tables(self, pending: list[LayerValidation]) -> set[str]:
+        """One meta-table query per poll; raises if the DAG run itself failed."""
+        status = self.composer_trigger.get_status(self.dag_id, self.dag_run_id)
+        if status.get("state") == "failed":
+            raise RuntimeError(f"DAG {self.dag_id} run {self.dag_run_id} failed")
+
+        datasets = sorted({t.split(".")[0] for layer in pending for t in layer.tables})
+        modified = self.bq_client.get_table_modified_times(datasets)
+        return {
+            layer.name
+            for layer in pending
+            if all(
+                table in modified and modified[table] >= self.triggered_at
+                for table in layer.tables
+            )
+        }
+
+    def _abort(self, reason: str):
+        if not self.abort_on_failure:
+            return
+        logger.error(f"Aborting DAG run {self.dag_run_id}: {reason}")
+        try:
+            self.composer_trigger.set_dag_run_state(
+                self.dag_id, self.dag_run_id, "failed"
+            )
+        except Exception as e:
+            logger.warning(f"Could not mark DAG run {self.dag_run_id} failed: {e}")
@@ -0,0 +1,323 @@
+import base64
+import json
+import logging
+import math
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, time, timezone
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+from ..clients.bigquery import BigQueryClient
+from ..clients.storage import StorageClient
+
+logger = logging.getLogger(__name__)
+
+NUMERIC_TYPES = {"INTEGER", "INT64", "FLOAT", "FLOAT64", "NUMERIC", "BIGNUMERIC"}
+TEMPORAL_TYPES = {"DATE", "DATETIME", "TIMESTAMP", "TIME"}
+CATEGORICAL_TYPES = {"STRING", "BOOLEAN", "BOOL", "BYTES"}
+
+
+@dataclass
+class ColumnProfile:
+    """Per-column statistics; approximate where the SQL aggregate is approximate."""
+
+    name: str
+    data_type: str
+    null_count: int
+    distinct_count: int
+    min: Any = None
+    max: Any = None
+    quantiles: list[Any] | None = None  # [min, p25, p50, p75, max] for numeric/temporal
+    top_values: list[list[Any]] | None = None  # [[value, count], ...] for categorical
+
+
+@dataclass
+class TableProfile:
+    table_id: str
+    row_count: int
+    columns: dict[str, ColumnProfile] = field(default_factory=dict)
+    profiled_at: str = ""
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "TableProfile":
+        columns = {
+            name: ColumnProfile(**col) for name, col in data.get("columns", {}).items()
+        }
+        return cls(
+            table_id=data["table_id"],
+            row_count=data["row_count"],
+            columns=columns,
+            profiled_at=data.get("profiled_at", ""),
+        )
+
+
+@dataclass(frozen=True)
+class ProfileDrift:
+    column: str | None  # None for table-level metrics
+    metric: str
+    baseline: Any
+    current: Any
+    detail: str = ""
+
+    def __str__(self) -> str:
+        target = self.column or "<table>"
+        text = f"{target}.{self.metric}: {self.baseline} -> {self.current}"
+        return f"{text} ({self.detail})" if self.detail else text
+
+
+def _json_value(value: Any) -> Any:
+    """Normalizes BigQuery result values into compact JSON-friendly values."""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, bytes):
+        return base64.b64encode(value).decode("ascii")
+    return value
+
+
+def build_profile_query(
+    table_id: str, columns: list[tuple[str, str]], top_k: int = 10
+) -> str:
+    """
+    Builds one aggregate query profiling every (name, type) column of a table.
+    Aliases are positional (c0_, c1_, ...) so any column name is safe.
+    """
+    select = ["COUNT(*) AS row_count"]
+    for i, (name, data_type) in enumerate(columns):
+        col = f"`{name}`"
+        select.append(f"COUNTIF({col} IS NULL) AS c{i}_nulls")
+        select.append(f"APPROX_COUNT_DISTINCT({col}) AS c{i}_distinct")
+        if data_type not in ("BOOLEAN", "BOOL"):
+            select.append(f"MIN({col}) AS c{i}_min")
+            select.append(f"MAX({col}) AS c{i}_max")
+        if data_type in NUMERIC_TYPES or data_type in TEMPORAL_TYPES:
+            select.append(f"APPROX_QUANTILES({col}, 4) AS c{i}_quantiles")
+        else:
+            select.append(f"APPROX_TOP_COUNT({col}, {top_k}) AS c{i}_top")
+    return "SELECT\n  " + ",\n  ".join(select) + f"\nFROM `{table_id}`"
+
+
+def profile_table(
+    bq_client: BigQueryClient,
+    table_id: str,
+    columns: list[str] | None = None,
+    top_k: int = 10,
+) -> TableProfile:
+    """
+    Profiles a table in a single scan: null counts, APPROX_COUNT_DISTINCT, min/max,
+    APPROX_QUANTILES for numeric/temporal and APPROX_TOP_COUNT for categorical
+    columns. Nested and repeated columns are skipped.
+    """
+    schema = bq_client.get_table(table_id).schema
+    profiled = [
+        (f.name, f.field_type)
+        for f in schema
+        if f.mode != "REPEATED"
+        and f.field_type in NUMERIC_TYPES | TEMPORAL_TYPES | CATEGORICAL_TYPES
+        and (columns is None or f.name in columns)
+    ]
+
+    query = build_profile_query(table_id, profiled, top_k=top_k)
+    row = bq_client.execute_query(query)[0]
+
+    profile = TableProfile(
+        table_id=table_id,
+        row_count=row["row_count"],
+        profiled_at=datetime.now(timezone.utc).isoformat(),
+    )
+    for i, (name, data_type) in enumerate(profiled):
+        quantiles = row.get(f"c{i}_quantiles")
+        top = row.get(f"c{i}_top")
+        profile.columns[name] = ColumnProfile(
+            name=name,
+            data_type=data_type,
+            null_count=row[f"c{i}_nulls"],
+            distinct_count=row[f"c{i}_distinct"],
+            min=_json_value(row.get(f"c{i}_min")),
+            max=_json_value(row.get(f"c{i}_max")),
+            quantiles=[_json_value(q) for q in quantiles] if quantiles else None,
+            top_values=(
+                [[_json_value(t["value"]), t["count"]] for t in top]
+                if top is not None
+                else None
+            ),
+        )
+    logger.info(
+        f"Profiled {len(profiled)} columns of {table_id} ({profile.row_count} rows)"
+    )
+    return profile
+
+
+class BaselineStore:
+    """
+    Stores profiles as compact JSON files under {root}/{env}/{name}.json,
+    so every environment keeps its own baselines.
+    """
+
+    def __init__(self, env: str, root: str | Path = "baselines"):
+        self.env = env
+        self.root = Path(root)
+
+    def _path(self, name: str) -> Path:
+        return self.root / self.env / f"{name}.json"
+
+    def exists(self, name: str) -> bool:
+        return self._path(name).exists()
+
+    def save(self, name: str, profile: TableProfile):
+        path = self._path(name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(profile.to_dict(), f, separators=(",", ":"), sort_keys=True)
+        logger.info(f"Saved profile baseline {path}")
+
+    def load(self, name: str) -> TableProfile | None:
+        path = self._path(name)
+        if not path.exists():
+            return None
+        with open(path, "r") as f:
+            return TableProfile.from_dict(json.load(f))
+
+
+class GcsBaselineStore:
+    """
+    Stores profiles as gs://{bucket}/{prefix}/{env}/{name}.json, so baselines
+    survive between CI runs (fresh checkouts) and are shared across runners.
+    """
+
+    def __init__(
+        self,
+        storage_client: StorageClient,
+        bucket: str,
+        env: str,
+        prefix: str = "profile-baselines",
+    ):
+        self.storage_client = storage_client
+        self.bucket = bucket
+        self.env = env
+        self.prefix = prefix.rstrip("/")
+
+    def _blob(self, name: str) -> str:
+        return f"{self.prefix}/{self.env}/{name}.json"
+
+    def exists(self, name: str) -> bool:
+        return self.storage_client.file_exists(self.bucket, self._blob(name))
+
+    def save(self, name: str, profile: TableProfile):
+        self.storage_client.upload_string(
+            self.bucket,
+            json.dumps(profile.to_dict(), separators=(",", ":"), sort_keys=True),
+            self._blob(name),
+        )
+        logger.info(f"Saved profile baseline gs://{self.bucket}/{self._blob(name)}")
+
+    def load(self, name: str) -> TableProfile | None:
+        data = self.storage_client.download_string(self.bucket, self._blob(name))
+        return TableProfile.from_dict(json.loads(data)) if data else None
+
+
+def _proportion_z(x1: int, n1: int, x2: int, n2: int) -> float:
+    """Two-proportion z statistic; inf when the rates differ with zero variance."""
+    if n1 == 0 or n2 == 0:
+        return 0.0
+    p1, p2 = x1 / n1, x2 / n2
+    pooled = (x1 + x2) / (n1 + n2)
+    se = math.sqrt(pooled * (1 - pooled) * (1 / n1 + 1 / n2))
+    if se == 0:
+        return 0.0 if p1 == p2 else math.inf
+    return abs(p1 - p2) / se
+
+
+def detect_drift(
+    baseline: TableProfile,
+    current: TableProfile,
+    z_threshold: float = 3.0,
+    min_rate_delta: float = 0.01,
+    row_count_tolerance: float = 0.2,
+    distinct_tolerance: float = 0.2,
+    quantile_shift: float = 0.5,
+) -> list[ProfileDrift]:
+    """
+    Compares a profile with its baseline. Rate metrics (null rate, top-value share)
+    drift when the change is both significant (two-proportion z > `z_threshold`)
+    and larger than `min_rate_delta`, so huge tables don't flag negligible moves.
+    Row and distinct counts use relative tolerances; numeric medians drift when
+    they move more than `quantile_shift` baseline IQRs.
+    """
+    drifts: list[ProfileDrift] = []
+    n1, n2 = baseline.row_count, current.row_count
+
+    if n1 == 0 and n2 > 0:
+        # an empty baseline has no scale for a relative tolerance
+        drifts.append(ProfileDrift(None, "row_count", n1, n2, "baseline was empty"))
+    elif n1 and abs(n2 - n1) / n1 > row_count_tolerance:
+        drifts.append(
+            ProfileDrift(
+                None, "row_count", n1, n2, f"> {row_count_tolerance:.0%} change"
+            )
+        )
+
+    for name, base in baseline.columns.items():
+        col = current.columns.get(name)
+        if col is None:
+            drifts.append(ProfileDrift(name, "column", "present", "missing"))
+            continue
+
+        rate1 = base.null_count / n1 if n1 else 0.0
+        rate2 = col.null_count / n2 if n2 else 0.0
+        z = _proportion_z(base.null_count, n1, col.null_count, n2)
+        if z > z_threshold and abs(rate2 - rate1) > min_rate_delta:
+            drifts.append(
+                ProfileDrift(
+                    name, "null_rate", round(rate1, 4), round(rate2, 4), f"z={z:.1f}"
+                )
+            )
+
+        if base.distinct_count:
+            change = abs(col.distinct_count - base.distinct_count) / base.distinct_count
+            if change > distinct_tolerance:
+                drifts.append(
+                    ProfileDrift(
+                        name, "distinct_count", base.distinct_count, col.distinct_count
+                    )
+                )
+
+        if base.data_type in NUMERIC_TYPES and base.quantiles and col.quantiles:
+            lo, med1, hi = base.quantiles[1], base.quantiles[2], base.quantiles[3]
+            scale = (
+                (hi - lo) or (base.quantiles[-1] - base.quantiles[0]) or abs(med1) or 1
+            )
+            shift = abs(col.quantiles[2] - med1) / scale
+            if shift > quantile_shift:
+                drifts.append(
+                    ProfileDrift(
+                        name, "median", med1, col.quantiles[2], f"{shift:.2f} IQR"
+                    )
+                )
+
+        if base.top_values and col.top_values is not None and n1 and n2:
+            current_counts = {value: count for value, count in col.top_values}
+            # A value that fell out of the top-k has at most the smallest top-k count
+            floor = min(current_counts.values(), default=0)
+            for value, count in base.top_values:
+                count2 = current_counts.get(value, floor)
+                if value not in current_counts and count / n1 <= count2 / n2:
+                    continue  # only a drop in share is certain for absent values
+                z = _proportion_z(count, n1, count2, n2)
+                if z > z_threshold and abs(count2 / n2 - count / n1) > min_rate_delta:
+                    drifts.append(
+                        ProfileDrift(
+                            name,
+                            f"top_value_share[{value}]",
+                            round(count / n1, 4),
+                            round(count2 / n2, 4),
+                            f"z={z:.1f}",
+                        )
+                    )
+
+    return drifts
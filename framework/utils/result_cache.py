@@ -0,0 +1,184 @@
+import hashlib
+import json
+import logging
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from ..clients.storage import StorageClient
+
+logger = logging.getLogger(__name__)
+
+
+def file_sha256(path: str | Path) -> str:
+    """Hashes a file in chunks so large seed files are never fully loaded."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def tree_sha256(root: str | Path, pattern: str = "**/*.py") -> str:
+    """
+    Hashes every file under `root` matching `pattern` (relative path + content),
+    e.g. the framework sources whose behaviour a cached green run depends on.
+    """
+    root = Path(root)
+    digest = hashlib.sha256()
+    for path in sorted(p for p in root.glob(pattern) if p.is_file()):
+        digest.update(path.relative_to(root).as_posix().encode() + b"\0")
+        digest.update(file_sha256(path).encode())
+    return digest.hexdigest()
+
+
+def compute_cache_key(
+    seed_file: str | Path,
+    dag_id: str,
+    dag_version: str,
+    validation_plan: Any,
+    env: str,
+) -> str:
+    """
+    Content-addresses an E2E run: the same seed bytes, DAG id/version, validation
+    plan (any JSON-serializable description) and environment give the same key.
+    """
+    components = {
+        "seed_sha256": file_sha256(seed_file),
+        "dag_id": dag_id,
+        "dag_version": dag_version,
+        "validation_plan": validation_plan,
+        "env": env,
+    }
+    encoded = json.dumps(components, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+@dataclass
+class CachedRun:
+    """Evidence of a verified green run and the table state it was verified against."""
+
+    key: str
+    table_modified_times: dict[str, str]  # "dataset.table" -> ISO timestamp
+    evidence: dict[str, Any] = field(default_factory=dict)
+    created_at: str = ""
+
+    def matches(self, modified_times: dict[str, datetime]) -> bool:
+        """True when every cached table still has its recorded modification time."""
+        return all(
+            table in modified_times and modified_times[table].isoformat() == recorded
+            for table, recorded in self.table_modified_times.items()
+        )
+
+    @classmethod
+    def from_run(
+        cls,
+        key: str,
+        modified_times: dict[str, datetime],
+        tables: list[str],
+        evidence: dict[str, Any] | None = None,
+    ) -> "CachedRun":
+        return cls(
+            key=key,
+            table_modified_times={t: modified_times[t].isoformat() for t in tables},
+            evidence=evidence or {},
+            created_at=datetime.now(timezone.utc).isoformat(),
+        )
+
+
+class LocalResultCache:
+    """Stores cached runs as {root}/{key}.json on local disk."""
+
+    def __init__(self, root: str | Path = ".etl_cache"):
+        self.root = Path(root)
+
+    def get(self, key: str) -> CachedRun | None:
+        path = self.root / f"{key}.json"
+        if not path.exists():
+            return None
+        with open(path, "r") as f:
+            return CachedRun(**json.load(f))
+
+    def put(self, run: CachedRun):
+        self.root.mkdir(parents=True, exist_ok=True)
+        with open(self.root / f"{run.key}.json", "w") as f:
+            json.dump(asdict(run), f, separators=(",", ":"), sort_keys=True)
+        logger.info(f"Cached green run {run.key} in {self.root}")
+
+
+class GcsResultCache:
+    """Stores cached runs as gs://{bucket}/{prefix}/{key}.json, shared across runners."""
+
+    def __init__(
+        self,
+        storage_client: StorageClient,
+        bucket: str,
+        prefix: str = "etl-result-cache",
+    ):
+        self.storage_client = storage_client
+        self.bucket = bucket
+        self.prefix = prefix.rstrip("/")
+
+    def get(self, key: str) -> CachedRun | None:
+        data = self.storage_client.download_string(
+            self.bucket, f"{self.prefix}/{key}.json"
+        )
+        return CachedRun(**json.loads(data)) if data else None
+
+    def put(self, run: CachedRun):
+        self.storage_client.upload_string(
+            self.bucket,
+            json.dumps(asdict(run), separators=(",", ":"), sort_keys=True),
+            f"{self.prefix}/{run.key}.json",
+        )
+        logger.info(f"Cached green run {run.key} in gs://{self.bucket}/{self.prefix}")
+
+
+class CachedSequence:
+    """
+    One cache entry for an ordered sequence of E2E steps that rebuild the same
+    tables (e.g. INI then CDC). Per-step entries would invalidate each other, so
+    the entry is keyed on every step key and recorded after the last step, once
+    every step ran green in this session. A hit leaves the tables untouched, so
+    later steps hit as well.
+    """
+
+    def __init__(
+        self, cache: LocalResultCache | GcsResultCache, step_keys: dict[str, str]
+    ):
+        self.cache = cache
+        self.steps = list(step_keys)
+        encoded = json.dumps(list(step_keys.items())).encode()
+        self.key = hashlib.sha256(encoded).hexdigest()
+        self._green: dict[str, dict[str, Any]] = {}
+
+    def lookup(
+        self, step: str, modified_times: dict[str, datetime]
+    ) -> CachedRun | None:
+        """The cached run while the sequence's tables are unmodified, else None."""
+        if step not in self.steps:
+            return None
+        cached = self.cache.get(self.key)
+        return cached if cached and cached.matches(modified_times) else None
+
+    def record(
+        self,
+        step: str,
+        modified_times: dict[str, datetime],
+        tables: list[str],
+        evidence: dict[str, Any],
+    ) -> CachedRun | None:
+        """
+        Marks `step` green; after the last step, caches the sequence if all its
+        steps ran green (a failed or cache-skipped earlier step is not verified
+        against the current table state).
+        """
+        if step not in self.steps:
+            return None
+        self._green[step] = evidence
+        if step != self.steps[-1] or set(self._green) != set(self.steps):
+            return None
+        run = CachedRun.from_run(self.key, modified_times, tables, dict(self._green))
+        self.cache.put(run)
+        return run
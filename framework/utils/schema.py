@@ -0,0 +1,224 @@
+import logging
+from dataclasses import dataclass, field
+from typing import Any
+
+from google.cloud import bigquery
+
+from ..clients.bigquery import BigQueryClient
+
+logger = logging.getLogger(__name__)
+
+# One sub-query per layer dataset; all of them are UNION ALL'd into a single job.
+# COLUMN_FIELD_PATHS flattens nested STRUCT/ARRAY fields into dotted paths,
+# COLUMNS adds top-level nullability that the field-path view does not expose.
+_LAYER_COLUMNS_SQL = """
+SELECT
+  '{layer}' AS layer,
+  p.table_name,
+  p.field_path,
+  p.data_type,
+  c.is_nullable,
+  c.ordinal_position
+FROM `{project_id}.{dataset}`.INFORMATION_SCHEMA.COLUMN_FIELD_PATHS AS p
+JOIN `{project_id}.{dataset}`.INFORMATION_SCHEMA.COLUMNS AS c
+  USING (table_name, column_name)
+WHERE c.is_hidden = 'NO'{table_filter}"""
+
+
+@dataclass(frozen=True)
+class ColumnSchema:
+    """A single (possibly nested) column as reported by INFORMATION_SCHEMA."""
+
+    field_path: str
+    data_type: str
+    mode: str
+
+    @property
+    def is_nested(self) -> bool:
+        return "." in self.field_path
+
+    @property
+    def is_record(self) -> bool:
+        return self.data_type.startswith(("STRUCT<", "ARRAY<STRUCT<"))
+
+
+@dataclass(frozen=True)
+class ColumnDrift:
+    """One difference between two table schemas."""
+
+    field_path: str
+    kind: str  # "missing", "extra", "type" or "mode"
+    left: str | None = None
+    right: str | None = None
+
+    def __str__(self) -> str:
+        if self.kind == "missing":
+            return f"missing: {self.field_path} ({self.left})"
+        if self.kind == "extra":
+            return f"extra: {self.field_path} ({self.right})"
+        return f"{self.kind}: {self.field_path} {self.left} -> {self.right}"
+
+
+@dataclass
+class SchemaDiff:
+    """Column, type, mode and nested-field drift from `left` to `right`."""
+
+    left: str
+    right: str
+    drifts: list[ColumnDrift] = field(default_factory=list)
+
+    def of_kind(self, kind: str) -> list[ColumnDrift]:
+        return [d for d in self.drifts if d.kind == kind]
+
+    @property
+    def missing(self) -> list[ColumnDrift]:
+        return self.of_kind("missing")
+
+    @property
+    def extra(self) -> list[ColumnDrift]:
+        return self.of_kind("extra")
+
+    @property
+    def type_changes(self) -> list[ColumnDrift]:
+        return self.of_kind("type")
+
+    @property
+    def mode_changes(self) -> list[ColumnDrift]:
+        return self.of_kind("mode")
+
+    @property
+    def nested(self) -> list[ColumnDrift]:
+        return [d for d in self.drifts if "." in d.field_path]
+
+    def __bool__(self) -> bool:
+        return bool(self.drifts)
+
+    def summary(self) -> str:
+        if not self.drifts:
+            return f"No schema drift between {self.left} and {self.right}."
+        lines = [f"Schema drift between {self.left} and {self.right}:"]
+        lines.extend(f"  {d}" for d in self.drifts)
+        return "\n".join(lines)
+
+
+def _column_mode(data_type: str, is_nullable: str | None, nested: bool) -> str:
+    if data_type.startswith("ARRAY<"):
+        return "REPEATED"
+    # Nullability is only exposed for top-level columns.
+    if not nested and is_nullable == "NO":
+        return "REQUIRED"
+    return "NULLABLE"
+
+
+class SchemaCatalog:
+    """
+    In-memory schema index keyed by (layer, table) -> {field_path: ColumnSchema}.
+    Build it once with `load_schema_catalog` and diff any pair of tables locally.
+    """
+
+    def __init__(self):
+        self._tables: dict[tuple[str, str], dict[str, ColumnSchema]] = {}
+
+    @classmethod
+    def from_rows(cls, rows: list[dict[str, Any]]) -> "SchemaCatalog":
+        """Builds a catalog from INFORMATION_SCHEMA rows (see `_LAYER_COLUMNS_SQL`)."""
+        catalog = cls()
+        ordered = sorted(rows, key=lambda r: (r["ordinal_position"], r["field_path"]))
+        for row in ordered:
+            path = row["field_path"]
+            column = ColumnSchema(
+                field_path=path,
+                data_type=row["data_type"],
+                mode=_column_mode(
+                    row["data_type"], row.get("is_nullable"), "." in path
+                ),
+            )
+            catalog._tables.setdefault((row["layer"], row["table_name"]), {})[
+                path
+            ] = column
+        return catalog
+
+    def tables(self, layer: str | None = None) -> list[tuple[str, str]]:
+        """Lists (layer, table) pairs, optionally restricted to one layer."""
+        return sorted(key for key in self._tables if layer in (None, key[0]))
+
+    def has_table(self, layer: str, table: str) -> bool:
+        return (layer, table) in self._tables
+
+    def get_columns(self, layer: str, table: str) -> dict[str, ColumnSchema]:
+        """Returns the columns of a table keyed by field path."""
+        try:
+            return self._tables[(layer, table)]
+        except KeyError:
+            raise KeyError(
+                f"Table {layer}.{table} not found in schema catalog"
+            ) from None
+
+    def diff(
+        self, left_layer: str, left_table: str, right_layer: str, right_table: str
+    ) -> SchemaDiff:
+        """Reports drift from the left (upstream) table to the right (downstream) one."""
+        left = self.get_columns(left_layer, left_table)
+        right = self.get_columns(right_layer, right_table)
+        result = SchemaDiff(
+            left=f"{left_layer}.{left_table}", right=f"{right_layer}.{right_table}"
+        )
+
+        for path, col in left.items():
+            other = right.get(path)
+            if other is None:
+                result.drifts.append(ColumnDrift(path, "missing", left=col.data_type))
+                continue
+            # STRUCT type strings embed every child; children are compared by path.
+            if col.data_type != other.data_type and not (
+                col.is_record and other.is_record
+            ):
+                result.drifts.append(
+                    ColumnDrift(path, "type", left=col.data_type, right=other.data_type)
+                )
+            if col.mode != other.mode:
+                result.drifts.append(
+                    ColumnDrift(path, "mode", left=col.mode, right=other.mode)
+                )
+
+        for path, col in right.items():
+            if path not in left:
+                result.drifts.append(ColumnDrift(path, "extra", right=col.data_type))
+
+        return result
+
+
+def load_schema_catalog(
+    bq_client: BigQueryClient,
+    layer_datasets: dict[str, str],
+    tables: list[str] | None = None,
+) -> SchemaCatalog:
+    """
+    Loads the schemas of every table in the given layer datasets with one query.
+    `layer_datasets` is usually `settings.layer_datasets`; `tables` optionally
+    restricts the catalog to the named tables.
+    """
+    table_filter = "\n  AND p.table_name IN UNNEST(@tables)" if tables else ""
+    query = "\nUNION ALL\n".join(
+        _LAYER_COLUMNS_SQL.format(
+            layer=layer,
+            project_id=bq_client.project_id,
+            dataset=dataset,
+            table_filter=table_filter,
+        )
+        for layer, dataset in layer_datasets.items()
+    )
+
+    job_config = None
+    if tables:
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[bigquery.ArrayQueryParameter("tables", "STRING", tables)]
+        )
+
+    rows = bq_client.execute_query(query, job_config=job_config)
+    catalog = SchemaCatalog.from_rows(rows)
+    logger.info(
+        f"Loaded schema catalog: {len(catalog.tables())} tables "
+        f"across {len(layer_datasets)} layers"
+    )
+    return catalog
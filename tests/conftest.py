@@ -2,6 +2,7 @@ import pytest
 import os
 import sys
 import allure
+import pytest_asyncio
 
 # Add framework to python path
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
@@ -52,6 +53,48 @@ def storage_client(app_settings):
     return StorageClient(project_id=app_settings.project_id)
 
 
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def aio_session():
+    """Shared aiohttp session (connection pool) for all async clients."""
+    from framework.clients.aio import create_session
+
+    session = create_session()
+    yield session
+    await session.close()
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_bq_client(app_settings, aio_session):
+    """Returns an AsyncBigQueryClient on the shared session."""
+    from framework.clients.aio import AsyncBigQueryClient
+    return AsyncBigQueryClient(
+        project_id=app_settings.project_id,
+        location=app_settings.bq_location,
+        session=aio_session,
+        max_concurrency=20,
+    )
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_storage_client(app_settings, aio_session):
+    """Returns an AsyncStorageClient on the shared session."""
+    from framework.clients.aio import AsyncStorageClient
+    return AsyncStorageClient(
+        project_id=app_settings.project_id, session=aio_session, max_concurrency=50
+    )
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_composer_trigger(app_settings, aio_session):
+    """Returns an AsyncComposerTrigger on the shared session."""
+    from framework.clients.aio import AsyncComposerTrigger
+    return AsyncComposerTrigger(
+        project_id=app_settings.project_id,
+        location=app_settings.composer_location,
+        composer_env_name=app_settings.composer_env_name,
+        webserver_url=app_settings.composer_webserver_url,
+        session=aio_session,
+        max_concurrency=5,
+    )
+
+
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
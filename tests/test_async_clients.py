@@ -0,0 +1,182 @@
+import asyncio
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+import allure
+from framework.clients.aio import AsyncBigQueryClient, AsyncStorageClient
+from framework.clients.aio.bigquery import _parse_row
+
+
+@allure.feature("Async Clients")
+@allure.story("BigQuery Row Decoding")
+@pytest.mark.unit
+def test_parse_row_decodes_rest_values():
+    fields = [
+        {"name": "id", "type": "INTEGER", "mode": "REQUIRED"},
+        {"name": "amount", "type": "NUMERIC"},
+        {"name": "active", "type": "BOOLEAN"},
+        {"name": "updated_at", "type": "TIMESTAMP"},
+        {"name": "load_date", "type": "DATE"},
+        {"name": "tags", "type": "STRING", "mode": "REPEATED"},
+        {
+            "name": "address",
+            "type": "RECORD",
+            "fields": [{"name": "city", "type": "STRING"}],
+        },
+        {"name": "email", "type": "STRING"},
+    ]
+    row = {
+        "f": [
+            {"v": "101"},
+            {"v": "12.50"},
+            {"v": "true"},
+            {"v": "1704103200000000"},
+            {"v": "2024-01-01"},
+            {"v": [{"v": "a"}, {"v": "b"}]},
+            {"v": {"f": [{"v": "Leeds"}]}},
+            {"v": None},
+        ]
+    }
+
+    assert _parse_row(fields, row) == {
+        "id": 101,
+        "amount": Decimal("12.50"),
+        "active": True,
+        "updated_at": datetime(2024, 1, 1, 10, 0, tzinfo=timezone.utc),
+        "load_date": date(2024, 1, 1),
+        "tags": ["a", "b"],
+        "address": {"city": "Leeds"},
+        "email": None,
+    }
+
+
+@allure.feature("Async Clients")
+@allure.story("BigQuery Job Polling")
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_execute_query_polls_until_complete_and_pages():
+    client = AsyncBigQueryClient(project_id="test-project", poll_interval=0)
+    schema = {"fields": [{"name": "n", "type": "INTEGER"}]}
+    responses = [
+        {"jobReference": {"jobId": "job_1"}},
+        {"jobComplete": False},
+        {
+            "jobComplete": True,
+            "schema": schema,
+            "rows": [{"f": [{"v": "1"}]}],
+            "pageToken": "p2",
+        },
+        {"jobComplete": True, "schema": schema, "rows": [{"f": [{"v": "2"}]}]},
+    ]
+    calls = []
+
+    async def fake_request(method, url, **kwargs):
+        calls.append((method, url, kwargs.get("params", {}).get("pageToken")))
+        return responses[len(calls) - 1]
+
+    client._request = fake_request
+
+    rows = await client.execute_query("SELECT n FROM t")
+
+    assert rows == [{"n": 1}, {"n": 2}]
+    assert [c[0] for c in calls] == ["POST", "GET", "GET", "GET"]
+    assert calls[-1][2] == "p2"
+
+
+class FakeResponse:
+    def __init__(self, status, body=b""):
+        self.status = status
+        self.body = body
+
+    async def read(self):
+        return self.body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    closed = False
+
+    def __init__(self, responses):
+        self.responses = responses  # url -> FakeResponse
+        self.requests = []
+
+    def request(self, method, url, headers=None, **kwargs):
+        self.requests.append((method, url, headers))
+        return self.responses[url]
+
+
+@allure.feature("Async Clients")
+@allure.story("Request Handling")
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_request_decodes_json_raw_and_errors():
+    session = FakeSession(
+        {
+            "u/json": FakeResponse(200, b'{"a": 1}'),
+            "u/empty": FakeResponse(204),
+            "u/raw": FakeResponse(200, b"DAG source"),
+            "u/missing": FakeResponse(404, b"not found"),
+            "u/error": FakeResponse(500, b"boom"),
+        }
+    )
+    credentials = SimpleNamespace(valid=True, token="t0k")
+    client = AsyncStorageClient(
+        "test-project", session=session, credentials=credentials
+    )
+
+    assert await client._request("GET", "u/json") == {"a": 1}
+    assert await client._request("DELETE", "u/empty") == {}
+    assert await client._request("GET", "u/raw", raw=True) == b"DAG source"
+    assert await client._request("GET", "u/missing", allow_not_found=True) is None
+    with pytest.raises(RuntimeError, match="GET u/error failed: 500 - boom"):
+        await client._request("GET", "u/error")
+    assert session.requests[0][2] == {"Authorization": "Bearer t0k"}
+
+
+@allure.feature("Async Clients")
+@allure.story("Request Handling")
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_request_refreshes_token_once_on_401():
+    session = FakeSession({"u/json": FakeResponse(401)})
+    refreshed = []
+
+    def refresh(request):
+        refreshed.append(request)
+        credentials.token = "fresh"
+        session.responses["u/json"] = FakeResponse(200, b'{"a": 1}')
+
+    credentials = SimpleNamespace(valid=True, token="stale", refresh=refresh)
+    client = AsyncStorageClient(
+        "test-project", session=session, credentials=credentials
+    )
+
+    assert await client._request("GET", "u/json") == {"a": 1}
+    assert [r[2]["Authorization"] for r in session.requests] == [
+        "Bearer stale",
+        "Bearer fresh",
+    ]
+    assert len(refreshed) == 1
+
+
+@allure.feature("Async Clients")
+@allure.story("Concurrent Queries")
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_async_bq_concurrent_queries(async_bq_client):
+    """
+    Runs several queries concurrently on one event loop.
+    Requires valid credentials.
+    """
+    with allure.step("Run 10 concurrent queries"):
+        results = await asyncio.gather(
+            *(async_bq_client.execute_query(f"SELECT {i} AS n") for i in range(10))
+        )
+    assert [r[0]["n"] for r in results] == list(range(10))
@@ -0,0 +1,273 @@
+from decimal import Decimal
+
+import pytest
+import allure
+from framework.utils.assertions import assert_query_results_match, assert_sql_result
+from framework.utils.compare import compare_rows
+
+
+class FakeBigQueryClient:
+    def __init__(self, results):
+        self.results = results  # query -> rows
+        self.queries = []
+
+    def iter_query(self, query, job_config=None, page_size=None):
+        self.queries.append(query)
+        return iter(self.results[query])
+
+
+def _rows(n, start=0):
+    return ({"id": i, "amount": Decimal(i) / 10} for i in range(start, start + n))
+
+
+@allure.feature("Result Comparison")
+@allure.story("Ordered Mode")
+@pytest.mark.unit
+def test_ordered_mode_reports_position_differences():
+    actual = [{"id": 1, "v": "a"}, {"id": 2, "v": "x"}, {"id": 3, "v": "c"}]
+    expected = [{"id": 1, "v": "a"}, {"id": 2, "v": "b"}]
+
+    result = compare_rows(iter(actual), iter(expected))
+
+    assert (result.matched, result.different, result.unexpected, result.missing) == (
+        1,
+        1,
+        1,
+        0,
+    )
+    assert result.mismatches[0].location == 1
+    assert result.mismatches[0].columns == ["v"]
+
+
+@allure.feature("Result Comparison")
+@allure.story("Multiset Mode")
+@pytest.mark.unit
+def test_multiset_mode_ignores_order_but_counts_duplicates():
+    actual = [{"id": 2}, {"id": 1}, {"id": 1}]
+    expected = [{"id": 1}, {"id": 2.0}, {"id": 3}]
+
+    result = compare_rows(actual, expected, mode="multiset")
+
+    assert result.matched == 2
+    assert (result.unexpected, result.missing) == (1, 1)
+    assert compare_rows(_rows(1000), reversed(list(_rows(1000))), mode="multiset").ok
+
+
+@allure.feature("Result Comparison")
+@allure.story("Multiset Mode")
+@pytest.mark.unit
+def test_multiset_mode_counts_out_of_order_duplicates_as_matched():
+    actual = [{"id": 1}, {"id": 1}, {"id": 2}, {"id": 2}]
+    expected = [{"id": 2}, {"id": 2}, {"id": 1}, {"id": 1}]
+
+    result = compare_rows(actual, expected, mode="multiset")
+
+    assert result.ok
+    assert result.matched == 4
+
+
+@allure.feature("Result Comparison")
+@allure.story("Numeric Canonicalization")
+@pytest.mark.unit
+@pytest.mark.parametrize("mode", ["ordered", "multiset", "keyed"])
+def test_numbers_compare_exactly(mode):
+    def compare(a, e):
+        return compare_rows(
+            [{"id": 1, "v": a}], [{"id": 1, "v": e}], mode=mode, key="id"
+        )
+
+    assert not compare(Decimal("0.30000000000000001"), Decimal("0.3")).ok
+    assert not compare(Decimal("1.0000000000000000000000000000001"), Decimal(1)).ok
+    assert not compare("1E+2", 100).ok
+    assert compare(0.1, Decimal("0.10")).ok
+    assert compare(100, Decimal("1E+2")).ok
+    assert compare(2.0, 2).ok
+
+
+@allure.feature("Result Comparison")
+@allure.story("Numeric Canonicalization")
+@pytest.mark.unit
+@pytest.mark.parametrize("mode", ["ordered", "multiset", "keyed"])
+def test_non_finite_numbers_compare_consistently(mode):
+    # Multiset mode hashes rows, so it takes no tolerances
+    tolerances = None if mode == "multiset" else {"v": 0.1}
+
+    def compare(a, e):
+        return compare_rows(
+            [{"id": 1, "v": a}],
+            [{"id": 1, "v": e}],
+            mode=mode,
+            key="id",
+            tolerances=tolerances,
+        )
+
+    nan, inf = float("nan"), float("inf")
+    assert compare(nan, nan).ok
+    assert compare(nan, Decimal("NaN")).ok
+    assert compare(Decimal("-NaN"), Decimal("sNaN")).ok
+    assert not compare(nan, 1.0).ok
+    assert not compare(1.0, nan).ok
+    assert not compare(nan, "NaN").ok
+    assert compare(inf, Decimal("Infinity")).ok
+    assert not compare(inf, -inf).ok
+    assert not compare(inf, 1e308).ok
+
+
+@allure.feature("Result Comparison")
+@allure.story("Keyed Mode")
+@pytest.mark.unit
+def test_keyed_mode_applies_column_tolerances():
+    actual = [
+        {"id": 1, "amount": 10.004},
+        {"id": 2, "amount": 20.5},
+        {"id": 4, "amount": 0},
+    ]
+    expected = [
+        {"id": 2, "amount": 20.0},
+        {"id": 1, "amount": 10.0},
+        {"id": 3, "amount": 1},
+    ]
+
+    result = compare_rows(
+        actual, expected, mode="keyed", key="id", tolerances={"amount": 0.01}
+    )
+
+    assert result.matched == 1
+    assert [(m.kind, m.location) for m in result.mismatches] == [
+        ("different", (2,)),
+        ("unexpected", (4,)),
+        ("missing", (3,)),
+    ]
+
+
+@allure.feature("Result Comparison")
+@allure.story("Keyed Mode")
+@pytest.mark.unit
+def test_keyed_mode_reports_differences_from_hashed_index():
+    actual = [
+        {"id": 1, "name": "Jane", "amount": 10.5},
+        {"id": 2, "name": "Bob", "amount": 1},
+        {"id": 3, "name": "Ann"},
+    ]
+    expected = [
+        {"id": 1, "name": "John", "amount": 10},
+        {"id": 2, "name": "Bob"},
+        {"id": 3, "name": "Ann", "amount": 3},
+        {"id": 4, "name": "Max", "amount": 4},
+    ]
+
+    # A one-shot stream cannot be re-read: hashed values stay hashed
+    result = compare_rows(
+        actual, iter(expected), mode="keyed", key="id", tolerances={"amount": 0.1}
+    )
+
+    assert [(m.location, m.columns) for m in result.mismatches] == [
+        ((1,), ["name", "amount"]),
+        ((2,), ["amount"]),
+        ((3,), ["amount"]),
+        ((4,), []),
+    ]
+    assert [str(m) for m in result.mismatches] == [
+        "different at (1,): name: 'Jane' != <hashed>, amount: 10.5 != 10",
+        "different at (2,): amount: 1 != <missing>",
+        "different at (3,): amount: <missing> != 3",
+        "missing at (4,): {'id': 4}",
+    ]
+
+    # A list, or `reread_expected`, gives the full expected rows back
+    result = compare_rows(
+        actual, expected, mode="keyed", key="id", tolerances={"amount": 0.1}
+    )
+    rereads = []
+    streamed = compare_rows(
+        actual,
+        iter(expected),
+        mode="keyed",
+        key="id",
+        tolerances={"amount": 0.1},
+        reread_expected=lambda: rereads.append(1) or iter(expected),
+    )
+
+    for r in (result, streamed):
+        assert [str(m) for m in r.mismatches] == [
+            "different at (1,): name: 'Jane' != 'John', amount: 10.5 != 10",
+            "different at (2,): amount: 1 != <missing>",
+            "different at (3,): amount: <missing> != 3",
+            "missing at (4,): {'id': 4, 'name': 'Max', 'amount': 4}",
+        ]
+    assert rereads == [1]
+    # Nothing to report: no second read
+    assert compare_rows(
+        iter(expected),
+        iter(expected),
+        mode="keyed",
+        key="id",
+        reread_expected=lambda: rereads.append(1) or [],
+    ).ok
+    assert rereads == [1]
+
+
+@allure.feature("Result Comparison")
+@allure.story("Bounded Diff")
+@pytest.mark.unit
+def test_diff_summary_is_bounded():
+    result = compare_rows(
+        _rows(10_000), _rows(10_000, start=1), mode="multiset", max_mismatches=5
+    )
+
+    assert (result.unexpected, result.missing) == (1, 1)
+    result = compare_rows(_rows(10_000), _rows(10_000, start=5_000), max_mismatches=5)
+
+    assert result.different == 10_000
+    assert len(result.mismatches) == 5
+    assert len(result.summary().splitlines()) == 8
+
+
+@allure.feature("Result Comparison")
+@allure.story("Validation")
+@pytest.mark.unit
+def test_invalid_options_raise():
+    with pytest.raises(ValueError):
+        compare_rows([], [], mode="keyed")
+    with pytest.raises(ValueError):
+        compare_rows([], [], mode="multiset", tolerances={"amount": 0.1})
+
+
+@allure.feature("Result Comparison")
+@allure.story("SQL Result Assertions")
+@pytest.mark.unit
+def test_assert_sql_result_streams_query_results():
+    client = FakeBigQueryClient(
+        {"q": [{"id": 1, "v": "a"}, {"id": 2, "v": "b"}], "empty": []}
+    )
+
+    assert_sql_result(client, "q")
+    assert_sql_result(
+        client, "q", [{"id": 2, "v": "b"}, {"id": 1, "v": "a"}], mode="multiset"
+    )
+    with pytest.raises(AssertionError, match="Query returned no rows"):
+        assert_sql_result(client, "empty")
+    with pytest.raises(AssertionError, match="different: 1"):
+        assert_sql_result(client, "q", [{"id": 1, "v": "a"}, {"id": 2, "v": "x"}])
+
+
+@allure.feature("Result Comparison")
+@allure.story("SQL Result Assertions")
+@pytest.mark.unit
+def test_assert_query_results_match_compares_both_queries():
+    client = FakeBigQueryClient(
+        {
+            "source": [{"id": 1, "amount": 1.0}, {"id": 2, "amount": 2.0}],
+            "target": [{"id": 2, "amount": Decimal("2.001")}, {"id": 1, "amount": 1}],
+        }
+    )
+
+    assert_query_results_match(
+        client, "target", "source", mode="keyed", key="id", tolerances={"amount": 0.01}
+    )
+    assert client.queries == ["target", "source"]
+    client.queries.clear()
+    with pytest.raises(AssertionError, match="amount: Decimal..2.001.. != 2.0"):
+        assert_query_results_match(client, "target", "source", mode="keyed", key="id")
+    # The expected query is re-run once to report the full expected rows
+    assert client.queries == ["target", "source", "source"]
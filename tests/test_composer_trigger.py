@@ -0,0 +1,74 @@
+import base64
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+import allure
+from framework.clients.triggers import ComposerTrigger
+
+
+def _id_token(expires_in, n=0):
+    """Unsigned JWT with an `exp` claim; only the payload is read."""
+
+    def encode(data):
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b"=").decode()
+
+    claims = {"exp": int(time.time()) + expires_in, "n": n}
+    return f"{encode({'alg': 'RS256', 'typ': 'JWT'})}.{encode(claims)}.c2ln"
+
+
+@pytest.fixture
+def fake_iap(monkeypatch):
+    """Patches ID token fetching and HTTP calls; returns the recorded state."""
+    state = SimpleNamespace(fetched=[], sent=[], statuses=[], expires_in=3600)
+
+    def fetch_id_token(request, audience):
+        token = _id_token(state.expires_in, len(state.fetched))
+        state.fetched.append(token)
+        return token
+
+    def request(method, url, headers=None, **kwargs):
+        state.sent.append(headers["Authorization"])
+        status = state.statuses.pop(0) if state.statuses else 200
+        return SimpleNamespace(
+            status_code=status, text="", json=lambda: {"state": "running"}
+        )
+
+    monkeypatch.setattr("google.oauth2.id_token.fetch_id_token", fetch_id_token)
+    monkeypatch.setattr("requests.request", request)
+    return state
+
+
+@allure.feature("Orchestration")
+@allure.story("IAP Token Refresh")
+@pytest.mark.unit
+def test_id_token_is_cached_until_close_to_expiry(fake_iap):
+    trigger = ComposerTrigger("p", "l", "env", "https://composer.example.com")
+
+    trigger.get_status("dag", "run_1")
+    trigger.get_status("dag", "run_1")
+    assert len(fake_iap.fetched) == 1
+
+    # A token that expires within the refresh margin is replaced before use
+    trigger._id_token = _id_token(60)
+    trigger._id_token_expiry = time.time() + 60
+    trigger.get_status("dag", "run_1")
+    assert len(fake_iap.fetched) == 2
+    assert fake_iap.sent[-1] == f"Bearer {fake_iap.fetched[-1]}"
+
+
+@allure.feature("Orchestration")
+@allure.story("IAP Token Refresh")
+@pytest.mark.unit
+def test_request_retries_once_with_fresh_token_on_401(fake_iap):
+    trigger = ComposerTrigger("p", "l", "env", "https://composer.example.com")
+    fake_iap.statuses = [401]
+
+    assert trigger.get_status("dag", "run_1") == {"state": "running"}
+    assert fake_iap.sent == [f"Bearer {token}" for token in fake_iap.fetched]
+    assert len(fake_iap.fetched) == 2
+
+    fake_iap.statuses = [401, 401]
+    with pytest.raises(RuntimeError, match="401"):
+        trigger.get_status("dag", "run_1")
@@ -1,16 +1,42 @@
 import pytest
 import allure
 import os
+import json
 import logging
-from framework.utils.assertions import assert_table_exists, assert_row_count, assert_schema_contains_columns
+from datetime import datetime, timezone
+from pathlib import Path
+from framework.utils.assertions import (
+    assert_table_exists,
+    assert_row_count,
+    assert_schema_lineage,
+    assert_no_profile_drift,
+)
+from framework.utils.pipeline import LayerValidation, PipelinedValidator
+from framework.utils.profiling import BaselineStore, GcsBaselineStore
+from framework.utils.result_cache import (
+    CachedSequence,
+    GcsResultCache,
+    LocalResultCache,
+    compute_cache_key,
+    file_sha256,
+    tree_sha256,
+)
+from framework.utils.schema import load_schema_catalog
 
 logger = logging.getLogger(__name__)
 
+DATA_DIR = Path(__file__).parent / "data"
+# Result cache entries of the parametrized INI -> CDC sequence, by sequence key
+_SEQUENCE_CACHES: dict[str, CachedSequence] = {}
+
+
 @allure.feature("E2E Pipeline")
 @allure.story("Full Data Flow")
 @pytest.mark.e2e
 @pytest.mark.parametrize("load_type", ["INI", "CDC"])  # Support both Initial and CDC flows
-def test_full_etl_pipeline(composer_trigger, bq_client, storage_client, app_settings, load_type):
+def test_full_etl_pipeline(
+    composer_trigger, bq_client, storage_client, app_settings, load_type, request
+):
     """
     Verifies the end-to-end data flow:
     GCS -> Composer -> Raw Structured -> Raw Vault -> Business Vault -> Consumption.
@@ -24,6 +50,8 @@ def test_full_etl_pipeline(composer_trigger, bq_client, storage_client, app_sett
     # Inputs (from Dispatch/Env)
     stop_at_layer = os.getenv("TEST_STOP_AT_LAYER", "all").lower()
     custom_csv = os.getenv("TEST_CSV_FILE")
+    validation_mode = os.getenv("TEST_VALIDATION_MODE", "sequential").lower()
+    update_baselines = os.getenv("TEST_UPDATE_BASELINES") == "1"
     
     # Datasets
     raw_struct = app_settings.raw_structured_ds
@@ -31,6 +59,183 @@ def test_full_etl_pipeline(composer_trigger, bq_client, storage_client, app_sett
     biz_vault = app_settings.business_vault_ds
     consumption = app_settings.consumption_ds
 
+    # 0. Data Seeding (CSV to GCS)
+    # Use custom CSV if provided, else default to load_type
+    if custom_csv:
+        csv_filename = custom_csv
+    else:
+        csv_filename = f"customer_{load_type.lower()}.csv"
+    
+    # Per-layer checks; run in order after the DAG (sequential) or as each
+    # layer lands (pipelined)
+    def validate_raw_structured():
+        # 3. Validate Layer 1: Raw Structured
+        with allure.step("Validate Raw Structured Layer"):
+            table_id = f"{app_settings.project_id}.{raw_struct}.{table_name}"
+            assert_table_exists(bq_client, table_id)
+            if load_type == "INI":
+                assert_row_count(bq_client, table_id, min_count=1)
+
+    def validate_raw_vault():
+        # 4. Validate Layer 2: Raw Vault (Hub Example)
+        with allure.step("Validate Raw Vault Layer"):
+            hub_table = f"{app_settings.project_id}.{raw_vault}.hub_customer"
+            assert_table_exists(bq_client, hub_table)
+
+    def validate_business_vault():
+        # 5. Validate Layer 3: Business Vault
+        with allure.step("Validate Business Vault Layer"):
+            bv_table = f"{app_settings.project_id}.{biz_vault}.bv_customer_360"
+            assert_table_exists(bq_client, bv_table)
+
+    def validate_consumption():
+        # 6. Validate Layer 4: Consumption
+        with allure.step("Validate Consumption Layer"):
+            dim_table = f"{app_settings.project_id}.{consumption}.dim_customer"
+            assert_table_exists(bq_client, dim_table)
+            # Volume/distribution regressions against the stored per-env baseline.
+            # Baselines live in the temp bucket so they outlive CI checkouts.
+            if os.getenv("TEST_BASELINE_STORE", "gcs").lower() == "local":
+                baseline_store = BaselineStore(env=app_settings.ENV)
+            else:
+                baseline_store = GcsBaselineStore(
+                    storage_client, app_settings.temp_bucket, env=app_settings.ENV
+                )
+            assert_no_profile_drift(
+                bq_client,
+                dim_table,
+                baseline_store,
+                baseline_name=f"dim_customer_{load_type.lower()}",
+                update_baseline=update_baselines,
+            )
+
+        # 7. Schema Consistency (Raw Vault vs Consumption)
+        with allure.step("Verify Schema Consistency"):
+            # One INFORMATION_SCHEMA query covers every layer dataset
+            catalog = load_schema_catalog(
+                bq_client,
+                app_settings.layer_datasets,
+                tables=["hub_customer", "dim_customer"],
+            )
+            assert_schema_lineage(
+                catalog,
+                upstream=("raw_vault", "hub_customer"),
+                downstream=("consumption", "dim_customer"),
+            )
+
+    # Task IDs are the DAG tasks that build each layer. Replace with your DAG's tasks.
+    layers = [
+        LayerValidation(
+            "raw_structured",
+            validate_raw_structured,
+            task_ids=["load_raw_structured"],
+            tables=[f"{raw_struct}.{table_name}"],
+        ),
+        LayerValidation(
+            "raw_vault",
+            validate_raw_vault,
+            task_ids=["load_raw_vault"],
+            tables=[f"{raw_vault}.hub_customer"],
+        ),
+        LayerValidation(
+            "business_vault",
+            validate_business_vault,
+            task_ids=["load_business_vault"],
+            tables=[f"{biz_vault}.bv_customer_360"],
+        ),
+        LayerValidation(
+            "consumption",
+            validate_consumption,
+            task_ids=["load_consumption"],
+            tables=[f"{consumption}.dim_customer"],
+        ),
+    ]
+    layer_names = [layer.name for layer in layers]
+    if stop_at_layer in layer_names:
+        logger.info(f"Stopping test at {stop_at_layer} layer as requested.")
+        layers = layers[: layer_names.index(stop_at_layer) + 1]
+
+    # --- Result Cache ---
+    # Skip the run when the same seeds, DAG version, validation plan and env
+    # already produced a green run and the target tables are untouched since.
+    # INI and CDC rebuild the same tables, so one entry covers the whole selected
+    # load-type sequence and is stored once its last step ran green.
+    use_cache = os.getenv("TEST_RESULT_CACHE", "local").lower() != "off"
+    cache_tables = [table for layer in layers for table in layer.tables]
+    cache_datasets = sorted({table.split(".")[0] for table in cache_tables})
+    # Load types selected for this session, in run order
+    sequence = [
+        item.callspec.params["load_type"]
+        for item in request.session.items
+        if item.originalname == request.node.originalname
+    ]
+    # Resolve from this file, not the CWD, so the cache key can hash the seeds
+    seed_paths = {
+        lt: DATA_DIR / (custom_csv or f"customer_{lt.lower()}.csv") for lt in sequence
+    }
+    missing_seeds = [str(path) for path in seed_paths.values() if not path.is_file()]
+    if use_cache and missing_seeds:
+        # The seeds may already be in the landing bucket; run without the cache
+        message = f"Seed files not found: {missing_seeds}; result cache bypassed."
+        logger.warning(message)
+        allure.attach(message, name="Result Cache Bypassed")
+        use_cache = False
+    if use_cache:
+        with allure.step("Check Result Cache"):
+            if os.getenv("TEST_RESULT_CACHE", "local").lower() == "gcs":
+                result_cache = GcsResultCache(storage_client, app_settings.temp_bucket)
+            else:
+                result_cache = LocalResultCache()
+            plan = {
+                "layers": [
+                    {
+                        "name": layer.name,
+                        "task_ids": layer.task_ids,
+                        "tables": layer.tables,
+                    }
+                    for layer in layers
+                ],
+                # The checks, and the framework code they call, define the plan too
+                "checks_sha256": file_sha256(__file__),
+                "framework_sha256": tree_sha256(
+                    Path(__file__).resolve().parents[1] / "framework"
+                ),
+                "update_baselines": update_baselines,
+            }
+            dag_version = os.getenv("TEST_DAG_VERSION")
+            if not dag_version:
+                dag_version = composer_trigger.get_dag_source_hash(dag_id)
+            step_keys = {
+                lt: compute_cache_key(
+                    seed_paths[lt],
+                    dag_id,
+                    dag_version,
+                    {**plan, "load_type": lt},
+                    app_settings.ENV,
+                )
+                for lt in sequence
+            }
+            # Shared across the parametrized runs so the last step can store it
+            sequence_cache = CachedSequence(result_cache, step_keys)
+            sequence_cache = _SEQUENCE_CACHES.setdefault(
+                sequence_cache.key, sequence_cache
+            )
+            allure.attach(sequence_cache.key, name="Cache Key")
+
+            cached = sequence_cache.lookup(
+                load_type, bq_client.get_table_modified_times(cache_datasets)
+            )
+            if cached:
+                allure.attach(
+                    json.dumps(cached.evidence.get(load_type, {}), indent=2),
+                    name="Cached Evidence",
+                    attachment_type=allure.attachment_type.JSON,
+                )
+                logger.info(
+                    f"Inputs unchanged since green run {cached.created_at}; skipping pipeline run."
+                )
+                return
+
     # --- Cleanup / Unseed (Optional) ---
     # Good practice to ensure clean state before dispatching
     # In a real pipeline, we might drop the whole dataset, but here we drop specific tables
@@ -38,93 +243,71 @@ def test_full_etl_pipeline(composer_trigger, bq_client, storage_client, app_sett
         f"{app_settings.project_id}.{raw_struct}.{table_name}",
         f"{app_settings.project_id}.{raw_vault}.hub_customer",
         f"{app_settings.project_id}.{biz_vault}.bv_customer_360",
-        f"{app_settings.project_id}.{consumption}.dim_customer"
+        f"{app_settings.project_id}.{consumption}.dim_customer",
     ]
-    
+
     with allure.step("Cleanup: Unseed BigQuery Tables"):
         for tid in full_table_ids:
-             # We use the bq_client to delete if exists
-             # Since we just added delete_table to the client, we can use it
-             try:
-                 bq_client.delete_table(tid)
-                 allure.attach(f"Deleted {tid}", name="Cleanup")
-             except Exception as e:
-                 logger.warning(f"Cleanup failed for {tid}: {e}")
-                 
+            # We use the bq_client to delete if exists
+            # Since we just added delete_table to the client, we can use it
+            try:
+                bq_client.delete_table(tid)
+                allure.attach(f"Deleted {tid}", name="Cleanup")
+            except Exception as e:
+                logger.warning(f"Cleanup failed for {tid}: {e}")
+
     # -----------------------------------
-    
-    # 0. Data Seeding (CSV to GCS)
-    # Use custom CSV if provided, else default to load_type
-    if custom_csv:
-        csv_filename = custom_csv
-    else:
-        csv_filename = f"customer_{load_type.lower()}.csv"
 
-    _source_path = f"tests/data/{csv_filename}" 
-    
     with allure.step(f"Seed Data: {load_type} Load"):
-         allure.attach(f"Seeding {load_type} data from {csv_filename} to GCS", name="Data Setup")
-         assert storage_client is not None
-    
+        allure.attach(
+            f"Seeding {load_type} data from {csv_filename} to GCS", name="Data Setup"
+        )
+        assert storage_client is not None
+
     # 1. Trigger the Pipeline
     with allure.step(f"Trigger ETL Composer DAG ({load_type})"):
         conf = {
-            "load_date": "2024-01-01", 
+            "load_date": "2024-01-01",
             "source_bucket": app_settings.landing_bucket,
             "load_type": load_type,
-            "input_file": csv_filename
+            "input_file": csv_filename,
         }
+        triggered_at = datetime.now(timezone.utc)
         run_id = composer_trigger.trigger_job(dag_id, conf)
         allure.attach(str(run_id), name="DAG Run ID")
         assert run_id is not None
-        
-    # 2. Wait for Completion (Simulation)
-    with allure.step("Wait for Pipeline Completion"):
-        pass
-
-    # 3. Validate Layer 1: Raw Structured
-    with allure.step("Validate Raw Structured Layer"):
-        table_id = f"{app_settings.project_id}.{raw_struct}.{table_name}"
-        assert_table_exists(bq_client, table_id)
-        if load_type == "INI":
-             assert_row_count(bq_client, table_id, min_count=1)
-             
-    if stop_at_layer == "raw_structured":
-        logger.info("Stopping test at raw_structured layer as requested.")
-        return
-
-    # 4. Validate Layer 2: Raw Vault (Hub Example)
-    with allure.step("Validate Raw Vault Layer"):
-        hub_table = f"{app_settings.project_id}.{raw_vault}.hub_customer"
-        assert_table_exists(bq_client, hub_table)
-
-    if stop_at_layer == "raw_vault":
-        logger.info("Stopping test at raw_vault layer as requested.")
-        return
-
-    # 5. Validate Layer 3: Business Vault
-    with allure.step("Validate Business Vault Layer"):
-        bv_table = f"{app_settings.project_id}.{biz_vault}.bv_customer_360"
-        assert_table_exists(bq_client, bv_table)
-        
-    if stop_at_layer == "business_vault":
-        logger.info("Stopping test at business_vault layer as requested.")
-        return
-
-    # 6. Validate Layer 4: Consumption
-    with allure.step("Validate Consumption Layer"):
-        dim_table = f"{app_settings.project_id}.{consumption}.dim_customer"
-        assert_table_exists(bq_client, dim_table)
-        
-    # 7. Schema Consistency (Raw Vault vs Consumption)
-    with allure.step("Verify Schema Consistency"):
-        rv_table_ref = f"{app_settings.project_id}.{raw_vault}.hub_customer"
-        # Only run get_table if we are "connected" (integration/e2e)
-        # Using check inside try/except block or knowing it might fail in pure mock env
-        try:
-            rv_table = bq_client.get_table(rv_table_ref)
-            rv_columns = [f.name for f in rv_table.schema]
-            cons_table_ref = f"{app_settings.project_id}.{consumption}.dim_customer"
-            assert_schema_contains_columns(bq_client, cons_table_ref, rv_columns)
-        except Exception as e:
-             logger.error(f"Skipping schema check in dev env: {e}")
+
+    if validation_mode == "pipelined":
+        # Validate each layer as soon as its upstream task finishes
+        with allure.step("Pipelined Layer Validation"):
+            validator = PipelinedValidator(
+                composer_trigger,
+                bq_client,
+                dag_id,
+                run_id,
+                layers,
+                readiness=os.getenv("TEST_READINESS", "tasks"),
+                poll_interval=float(os.getenv("TEST_POLL_INTERVAL", "30")),
+                triggered_at=triggered_at,
+            )
+            timings = validator.run()
+            allure.attach(str(timings), name="Layer Validation Timings (s)")
+    else:
+        # 2. Wait for Completion (Simulation)
+        with allure.step("Wait for Pipeline Completion"):
+            pass
+
+        for layer in layers:
+            layer.check()
+
+    # Record the green run so unchanged re-runs can be skipped
+    if use_cache:
+        with allure.step("Store Result Cache"):
+            modified_times = bq_client.get_table_modified_times(cache_datasets)
+            evidence = {
+                "dag_run_id": run_id,
+                "load_type": load_type,
+                "input_file": csv_filename,
+                "validated_layers": [layer.name for layer in layers],
+            }
+            sequence_cache.record(load_type, modified_times, cache_tables, evidence)
@@ -0,0 +1,225 @@
+import pytest
+import allure
+import os
+import json
+import logging
+import uuid
+from dataclasses import asdict
+from types import SimpleNamespace
+from datetime import datetime, timezone
+from framework.utils.benchmark import (
+    BenchmarkRecorder,
+    BenchmarkResult,
+    GcsBenchmarkRecorder,
+    layer_timings,
+    wait_for_dag_run,
+)
+from framework.utils.loadgen import CdcMix, generate_cdc, generate_shards, upload_shards
+
+logger = logging.getLogger(__name__)
+
+# DAG tasks that build each layer. Replace with your DAG's tasks.
+LAYER_TASKS = {
+    "raw_structured": "load_raw_structured",
+    "raw_vault": "load_raw_vault",
+    "business_vault": "load_business_vault",
+    "consumption": "load_consumption",
+}
+
+# Comma-separated row counts, e.g. TEST_LOAD_ROWS=1000000,10000000,100000000
+LOAD_SIZES = [int(n) for n in os.getenv("TEST_LOAD_ROWS", "").split(",") if n]
+
+
+@allure.feature("Load Testing")
+@allure.story("Synthetic Data")
+@pytest.mark.unit
+def test_generated_shards_cover_requested_rows():
+    shards = list(generate_shards("INI", 25_000, shard_rows=10_000))
+
+    assert [len(s) for s in shards] == [10_000, 10_000, 5_000]
+    ids = [i for s in shards for i in s["customer_id"]]
+    assert ids == list(range(1, 25_001))
+    assert list(shards[0].columns) == [
+        "customer_id",
+        "name",
+        "email",
+        "region",
+        "updated_at",
+    ]
+
+
+@allure.feature("Load Testing")
+@allure.story("Synthetic Data")
+@pytest.mark.unit
+def test_cdc_batch_has_expected_op_mix_and_late_arrivals():
+    mix = CdcMix(insert=0.2, update=0.7, delete=0.1, late_arrival=0.05)
+
+    df = generate_cdc(100_000, existing_rows=1_000, next_id=1_001, mix=mix, seed=7)
+
+    shares = df["op"].value_counts(normalize=True)
+    assert shares["I"] == pytest.approx(0.2, abs=0.01)
+    assert shares["U"] == pytest.approx(0.7, abs=0.01)
+    assert shares["D"] == pytest.approx(0.1, abs=0.01)
+    inserts = df[df["op"] == "I"]["customer_id"]
+    assert inserts.min() == 1_001 and inserts.is_unique
+    assert df[df["op"] != "I"]["customer_id"].max() <= 1_000
+    late = (df["updated_at"] < datetime(2024, 1, 2)).mean()
+    assert late == pytest.approx(0.05, abs=0.01)
+
+
+@allure.feature("Load Testing")
+@allure.story("Layer Timings")
+@pytest.mark.unit
+def test_layer_timings_from_task_instances():
+    triggered_at = datetime(2024, 1, 1, 10, 0, tzinfo=timezone.utc)
+    task_instances = [
+        {
+            "task_id": "load_raw_structured",
+            "start_date": "2024-01-01T10:01:00+00:00",
+            "end_date": "2024-01-01T10:03:00+00:00",
+        },
+        {
+            "task_id": "load_raw_vault",
+            "start_date": "2024-01-01T10:03:00+00:00",
+            "end_date": None,
+        },
+        {
+            "task_id": "load_business_vault",
+            "start_date": "2024-01-01T10:04:00+00:00",
+            "end_date": "2024-01-01T10:04:00+00:00",
+        },
+    ]
+
+    timings = layer_timings(task_instances, LAYER_TASKS, triggered_at, rows=1_200)
+
+    assert len(timings) == 2
+    assert timings[0].layer == "raw_structured"
+    assert timings[0].seconds == 120
+    assert timings[0].latency_seconds == 180
+    assert timings[0].rows_per_second == 10
+    # Zero-length tasks have no throughput, and results stay valid JSON
+    assert timings[1].rows_per_second is None
+    json.dumps([asdict(t) for t in timings], allow_nan=False)
+
+
+class FakeStorageClient:
+    def __init__(self):
+        self.blobs = {}
+
+    def upload_string(self, bucket_name, data, destination_blob_name):
+        self.blobs[(bucket_name, destination_blob_name)] = data
+
+    def download_string(self, bucket_name, blob_name):
+        return self.blobs.get((bucket_name, blob_name))
+
+    def list_blobs(self, bucket_name, prefix=None):
+        return [
+            SimpleNamespace(name=name)
+            for bucket, name in self.blobs
+            if bucket == bucket_name and name.startswith(prefix or "")
+        ]
+
+
+@allure.feature("Load Testing")
+@allure.story("Benchmark Store")
+@pytest.mark.unit
+def test_gcs_benchmark_recorder_keeps_every_result_per_env():
+    storage = FakeStorageClient()
+    dev = GcsBenchmarkRecorder(storage, "temp-bucket", env="dev")
+
+    def result(load_type, rows, recorded_at):
+        return BenchmarkResult(
+            "dev", load_type, rows, 1, 1.0, 2.0, "success", recorded_at=recorded_at
+        )
+
+    dev.record(result("CDC", 1_000, "2024-01-02T10:00:00+00:00"))
+    dev.record(result("INI", 1_000, "2024-01-01T10:00:00+00:00"))
+    dev.record(result("INI", 10_000, "2024-01-01T10:00:00+00:00"))
+    recorded = dev.load()
+
+    assert [(r["load_type"], r["rows"]) for r in recorded] == [
+        ("INI", 1_000),
+        ("INI", 10_000),
+        ("CDC", 1_000),
+    ]
+    assert all(bucket == "temp-bucket" for bucket, _ in storage.blobs)
+    assert GcsBenchmarkRecorder(storage, "temp-bucket", env="staging").load() == []
+
+
+@allure.feature("Load Testing")
+@allure.story("Pipeline Throughput")
+@pytest.mark.load
+@pytest.mark.skipif(not LOAD_SIZES, reason="Set TEST_LOAD_ROWS to run load benchmarks")
+@pytest.mark.parametrize("rows", LOAD_SIZES)
+@pytest.mark.parametrize("load_type", ["INI", "CDC"])
+def test_pipeline_throughput(
+    composer_trigger, storage_client, app_settings, load_type, rows
+):
+    """
+    Seeds `rows` synthetic customers as sharded CSVs, runs the DAG and records
+    end-to-end latency and per-layer throughput as a benchmark result.
+    """
+    dag_id = "main_etl_pipeline"
+    shard_rows = int(os.getenv("TEST_LOAD_SHARD_ROWS", "1000000"))
+    prefix = f"load_test/{load_type.lower()}_{rows}_{uuid.uuid4().hex[:8]}/customer"
+
+    with allure.step(f"Seed {rows} {load_type} rows to GCS"):
+        seed = upload_shards(
+            storage_client,
+            app_settings.landing_bucket,
+            prefix,
+            generate_shards(load_type, rows, shard_rows=shard_rows),
+        )
+        allure.attach(
+            f"{len(seed.blobs)} shards, {seed.bytes} bytes, {seed.seconds:.1f}s",
+            name="Seed Summary",
+        )
+
+    with allure.step(f"Trigger ETL Composer DAG ({load_type})"):
+        conf = {
+            "load_date": "2024-01-01",
+            "source_bucket": app_settings.landing_bucket,
+            "load_type": load_type,
+            "input_file": f"{prefix}-*.csv",
+        }
+        triggered_at = datetime.now(timezone.utc)
+        run_id = composer_trigger.trigger_job(dag_id, conf)
+        assert run_id is not None
+
+    with allure.step("Wait for Pipeline Completion"):
+        state = wait_for_dag_run(
+            composer_trigger,
+            dag_id,
+            run_id,
+            poll_interval=float(os.getenv("TEST_POLL_INTERVAL", "30")),
+        )
+
+    with allure.step("Record Benchmark"):
+        task_instances = composer_trigger.get_task_instances(dag_id, run_id)
+        timings = layer_timings(task_instances, LAYER_TASKS, triggered_at, rows)
+        result = BenchmarkResult(
+            env=app_settings.ENV,
+            load_type=load_type,
+            rows=rows,
+            shards=len(seed.blobs),
+            seed_seconds=seed.seconds,
+            end_to_end_seconds=max((t.latency_seconds for t in timings), default=0.0),
+            dag_state=state,
+            layers=timings,
+            dag_run_id=run_id,
+        )
+        # Results live in the temp bucket so they outlive CI checkouts
+        if os.getenv("TEST_BENCHMARK_STORE", "gcs").lower() == "local":
+            recorder = BenchmarkRecorder(env=app_settings.ENV)
+        else:
+            recorder = GcsBenchmarkRecorder(
+                storage_client, app_settings.temp_bucket, env=app_settings.ENV
+            )
+        recorder.record(result)
+        allure.attach(str(result.to_dict()), name="Benchmark Result")
+
+    with allure.step("Cleanup: Remove seeded shards"):
+        for blob in seed.blobs:
+            storage_client.delete_blob(app_settings.landing_bucket, blob)
+
+    assert state == "success", f"DAG run {run_id} finished in state {state}"
@@ -0,0 +1,106 @@
+import pytest
+import allure
+from framework.utils.pipeline import LayerValidation, PipelinedValidator
+
+
+class FakeComposerTrigger:
+    """Replays one task-instance snapshot per poll."""
+
+    def __init__(self, snapshots):
+        self.snapshots = snapshots
+        self.polls = 0
+        self.states_set = []
+
+    def get_task_instances(self, dag_id, dag_run_id):
+        snapshot = self.snapshots[min(self.polls, len(self.snapshots) - 1)]
+        self.polls += 1
+        return [{"task_id": t, "state": s} for t, s in snapshot.items()]
+
+    def set_dag_run_state(self, dag_id, dag_run_id, state="failed"):
+        self.states_set.append(state)
+
+
+def _layers(validated, fail_on=None):
+    def check(name):
+        def run():
+            validated.append(name)
+            assert name != fail_on, f"{name} check failed"
+
+        return run
+
+    return [
+        LayerValidation(name, check(name), task_ids=[f"load_{name}"])
+        for name in ["raw_structured", "raw_vault", "consumption"]
+    ]
+
+
+@allure.feature("E2E Pipeline")
+@allure.story("Pipelined Validation")
+@pytest.mark.unit
+def test_layers_validated_as_their_tasks_finish():
+    composer = FakeComposerTrigger(
+        [
+            {"load_raw_structured": "running"},
+            {"load_raw_structured": "success", "load_raw_vault": "running"},
+            {
+                "load_raw_structured": "success",
+                "load_raw_vault": "success",
+                "load_consumption": "success",
+            },
+        ]
+    )
+    validated = []
+
+    timings = PipelinedValidator(
+        composer, None, "dag", "run", _layers(validated), poll_interval=0
+    ).run()
+
+    assert validated == ["raw_structured", "raw_vault", "consumption"]
+    assert list(timings) == validated
+    assert composer.polls == 3
+    assert composer.states_set == []
+
+
+@allure.feature("E2E Pipeline")
+@allure.story("Pipelined Validation")
+@pytest.mark.unit
+def test_failed_check_aborts_dag_run():
+    composer = FakeComposerTrigger(
+        [
+            {"load_raw_structured": "success", "load_raw_vault": "success"},
+        ]
+    )
+    validated = []
+
+    with pytest.raises(AssertionError, match="raw_vault check failed"):
+        PipelinedValidator(
+            composer,
+            None,
+            "dag",
+            "run",
+            _layers(validated, fail_on="raw_vault"),
+            poll_interval=0,
+        ).run()
+
+    assert validated == ["raw_structured", "raw_vault"]
+    assert composer.states_set == ["failed"]
+
+
+@allure.feature("E2E Pipeline")
+@allure.story("Pipelined Validation")
+@pytest.mark.unit
+def test_failed_task_aborts_before_validating_downstream():
+    composer = FakeComposerTrigger(
+        [
+            {"load_raw_structured": "success", "load_raw_vault": "failed"},
+        ]
+    )
+    validated = []
+
+    with pytest.raises(RuntimeError, match="load_raw_vault"):
+        PipelinedValidator(
+            composer, None, "dag", "run", _layers(validated), poll_interval=0
+        ).run()
+
+    assert validated == []
+    assert composer.states_set == ["failed"]
@@ -0,0 +1,217 @@
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+import allure
+from framework.utils.assertions import assert_no_profile_drift
+from framework.utils.profiling import (
+    BaselineStore,
+    ColumnProfile,
+    GcsBaselineStore,
+    TableProfile,
+    detect_drift,
+    profile_table,
+)
+
+
+class FakeStorageClient:
+    def __init__(self):
+        self.blobs = {}
+
+    def file_exists(self, bucket, path):
+        return (bucket, path) in self.blobs
+
+    def upload_string(self, bucket_name, data, destination_blob_name):
+        self.blobs[(bucket_name, destination_blob_name)] = data
+
+    def download_string(self, bucket_name, blob_name):
+        return self.blobs.get((bucket_name, blob_name))
+
+
+class FakeBigQueryClient:
+    def __init__(self, schema, row):
+        self.schema = schema
+        self.row = row
+        self.queries = []
+
+    def get_table(self, table_id):
+        return SimpleNamespace(schema=self.schema)
+
+    def execute_query(self, query, job_config=None):
+        self.queries.append(query)
+        return [self.row]
+
+
+def _profile(row_count, null_count=0, distinct=100, median=50, top=None):
+    return TableProfile(
+        table_id="p.d.t",
+        row_count=row_count,
+        columns={
+            "amount": ColumnProfile(
+                "amount",
+                "NUMERIC",
+                null_count,
+                distinct,
+                0,
+                100,
+                [0, 25, median, 75, 100],
+            ),
+            "region": ColumnProfile(
+                "region", "STRING", 0, 4, "East", "West", top_values=top or []
+            ),
+        },
+    )
+
+
+@allure.feature("Data Profiling")
+@allure.story("Single-Scan Profile")
+@pytest.mark.unit
+def test_profile_table_uses_one_aggregate_query():
+    schema = [
+        SimpleNamespace(name="amount", field_type="NUMERIC", mode="NULLABLE"),
+        SimpleNamespace(name="region", field_type="STRING", mode="NULLABLE"),
+        SimpleNamespace(name="tags", field_type="STRING", mode="REPEATED"),
+    ]
+    row = {
+        "row_count": 10,
+        "c0_nulls": 1,
+        "c0_distinct": 9,
+        "c0_min": Decimal("1"),
+        "c0_max": Decimal("9"),
+        "c0_quantiles": [
+            Decimal("1"),
+            Decimal("3"),
+            Decimal("5"),
+            Decimal("7"),
+            Decimal("9"),
+        ],
+        "c1_nulls": 0,
+        "c1_distinct": 2,
+        "c1_min": "North",
+        "c1_max": "South",
+        "c1_top": [{"value": "North", "count": 6}, {"value": "South", "count": 4}],
+    }
+    client = FakeBigQueryClient(schema, row)
+
+    profile = profile_table(client, "p.d.t")
+
+    assert len(client.queries) == 1
+    assert "APPROX_QUANTILES(`amount`, 4)" in client.queries[0]
+    assert "APPROX_TOP_COUNT(`region`, 10)" in client.queries[0]
+    assert "tags" not in client.queries[0]
+    assert profile.columns["amount"].quantiles == [1.0, 3.0, 5.0, 7.0, 9.0]
+    assert profile.columns["region"].top_values == [["North", 6], ["South", 4]]
+
+
+@allure.feature("Data Profiling")
+@allure.story("Baseline Store")
+@pytest.mark.unit
+def test_baseline_round_trip_per_env(tmp_path):
+    profile = _profile(1000, top=[["East", 500]])
+
+    BaselineStore(env="dev", root=tmp_path).save("t", profile)
+
+    assert BaselineStore(env="dev", root=tmp_path).load("t") == profile
+    assert BaselineStore(env="staging", root=tmp_path).load("t") is None
+
+
+@allure.feature("Data Profiling")
+@allure.story("Baseline Store")
+@pytest.mark.unit
+def test_gcs_baseline_store_round_trip_per_env():
+    storage = FakeStorageClient()
+    profile = _profile(1000, top=[["East", 500]])
+
+    GcsBaselineStore(storage, "temp-bucket", env="dev").save("t", profile)
+
+    assert list(storage.blobs) == [("temp-bucket", "profile-baselines/dev/t.json")]
+    assert GcsBaselineStore(storage, "temp-bucket", env="dev").load("t") == profile
+    assert GcsBaselineStore(storage, "temp-bucket", env="dev").exists("t")
+    assert GcsBaselineStore(storage, "temp-bucket", env="staging").load("t") is None
+
+
+@allure.feature("Data Profiling")
+@allure.story("Drift Detection")
+@pytest.mark.unit
+def test_detect_drift_flags_significant_changes_only():
+    baseline = _profile(
+        100_000, null_count=1_000, top=[["East", 50_000], ["West", 30_000]]
+    )
+
+    # Same shape, small noise: no drift
+    stable = _profile(
+        101_000, null_count=1_020, top=[["East", 50_400], ["West", 30_100]]
+    )
+    assert detect_drift(baseline, stable) == []
+
+    shifted = _profile(
+        50_000,
+        null_count=5_000,
+        distinct=40,
+        median=90,
+        top=[["West", 40_000], ["North", 1_000]],
+    )
+    metrics = {(d.column, d.metric) for d in detect_drift(baseline, shifted)}
+    assert metrics == {
+        (None, "row_count"),
+        ("amount", "null_rate"),
+        ("amount", "distinct_count"),
+        ("amount", "median"),
+        ("region", "top_value_share[East]"),
+        ("region", "top_value_share[West]"),
+    }
+
+
+@allure.feature("Data Profiling")
+@allure.story("Drift Detection")
+@pytest.mark.unit
+def test_detect_drift_flags_rows_against_empty_baseline():
+    empty = _profile(0, distinct=0)
+
+    assert detect_drift(empty, _profile(0, distinct=0)) == []
+    drifts = detect_drift(empty, _profile(5_000))
+    assert [(d.column, d.metric, d.baseline, d.current) for d in drifts] == [
+        (None, "row_count", 0, 5_000)
+    ]
+
+
+@allure.feature("Data Profiling")
+@allure.story("Profile Drift Assertion")
+@pytest.mark.unit
+def test_assert_no_profile_drift_records_then_compares(tmp_path):
+    schema = [SimpleNamespace(name="amount", field_type="INT64", mode="NULLABLE")]
+
+    def row(row_count, nulls):
+        return {
+            "row_count": row_count,
+            "c0_nulls": nulls,
+            "c0_distinct": 100,
+            "c0_min": 0,
+            "c0_max": 100,
+            "c0_quantiles": [0, 25, 50, 75, 100],
+        }
+
+    store = BaselineStore(env="dev", root=tmp_path)
+
+    with pytest.warns(UserWarning, match="no baseline found"):
+        assert_no_profile_drift(
+            FakeBigQueryClient(schema, row(10_000, 100)), "p.d.t", store, "t"
+        )
+    assert store.exists("t")
+
+    assert_no_profile_drift(
+        FakeBigQueryClient(schema, row(10_050, 102)), "p.d.t", store, "t"
+    )
+    with pytest.raises(AssertionError, match="null_rate"):
+        assert_no_profile_drift(
+            FakeBigQueryClient(schema, row(10_000, 3_000)), "p.d.t", store, "t"
+        )
+    with pytest.warns(UserWarning, match="re-recorded"):
+        assert_no_profile_drift(
+            FakeBigQueryClient(schema, row(10_000, 3_000)),
+            "p.d.t",
+            store,
+            "t",
+            update_baseline=True,
+        )
+    assert store.load("t").columns["amount"].null_count == 3_000
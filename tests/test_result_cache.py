@@ -0,0 +1,133 @@
+from datetime import datetime, timezone
+
+import pytest
+import allure
+from framework.utils.result_cache import (
+    CachedRun,
+    CachedSequence,
+    LocalResultCache,
+    compute_cache_key,
+    tree_sha256,
+)
+
+T0 = datetime(2024, 1, 1, 10, 0, tzinfo=timezone.utc)
+T1 = datetime(2024, 1, 1, 11, 0, tzinfo=timezone.utc)
+T2 = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+TABLES = ["rs.customer_data", "cons.dim_customer"]
+
+
+@allure.feature("Result Cache")
+@allure.story("Cache Key")
+@pytest.mark.unit
+def test_cache_key_changes_with_any_input(tmp_path):
+    seed = tmp_path / "seed.csv"
+    seed.write_text("customer_id\n101\n")
+    plan = {"layers": ["raw_structured"]}
+    key = compute_cache_key(seed, "dag", "v1", plan, "dev")
+
+    assert key == compute_cache_key(seed, "dag", "v1", dict(plan), "dev")
+    assert key != compute_cache_key(seed, "dag", "v2", plan, "dev")
+    assert key != compute_cache_key(seed, "dag", "v1", {"layers": []}, "dev")
+    assert key != compute_cache_key(seed, "dag", "v1", plan, "staging")
+
+    seed.write_text("customer_id\n102\n")
+    assert key != compute_cache_key(seed, "dag", "v1", plan, "dev")
+
+
+@allure.feature("Result Cache")
+@allure.story("Cache Key")
+@pytest.mark.unit
+def test_tree_hash_tracks_source_changes(tmp_path):
+    (tmp_path / "utils").mkdir()
+    (tmp_path / "utils" / "compare.py").write_text("MODES = ()\n")
+    (tmp_path / "notes.txt").write_text("ignored")
+    digest = tree_sha256(tmp_path)
+
+    (tmp_path / "notes.txt").write_text("still ignored")
+    assert tree_sha256(tmp_path) == digest
+
+    (tmp_path / "utils" / "compare.py").write_text("MODES = ('ordered',)\n")
+    assert tree_sha256(tmp_path) != digest
+
+    (tmp_path / "utils" / "compare.py").write_text("MODES = ()\n")
+    assert tree_sha256(tmp_path) == digest
+    (tmp_path / "utils" / "compare.py").rename(tmp_path / "compare.py")
+    assert tree_sha256(tmp_path) != digest
+
+
+@allure.feature("Result Cache")
+@allure.story("Local Store")
+@pytest.mark.unit
+def test_cached_run_reused_only_while_tables_unchanged(tmp_path):
+    cache = LocalResultCache(tmp_path)
+    times = {"rs.customer_data": T0, "cons.dim_customer": T0, "other.t": T1}
+    cache.put(
+        CachedRun.from_run(
+            "k1",
+            times,
+            ["rs.customer_data", "cons.dim_customer"],
+            {"dag_run_id": "run_1"},
+        )
+    )
+
+    cached = cache.get("k1")
+
+    assert cached.evidence == {"dag_run_id": "run_1"}
+    assert cached.matches(times)
+    assert not cached.matches({**times, "cons.dim_customer": T1})
+    assert not cached.matches({"rs.customer_data": T0})
+    assert cache.get("k2") is None
+
+
+@allure.feature("Result Cache")
+@allure.story("Load-Type Sequence")
+@pytest.mark.unit
+def test_sequence_of_load_types_hits_on_rerun(tmp_path):
+    cache = LocalResultCache(tmp_path)
+    step_keys = {"INI": "key-ini", "CDC": "key-cdc"}
+    tables = {}
+
+    def run_session():
+        """INI then CDC against shared tables; returns the steps served from cache."""
+        sequence = CachedSequence(cache, step_keys)
+        hits = []
+        for step, rebuilt_at in [("INI", T1), ("CDC", T2)]:
+            if sequence.lookup(step, tables):
+                hits.append(step)
+                continue
+            # Running a load type rebuilds the shared tables
+            tables.update(dict.fromkeys(TABLES, rebuilt_at))
+            sequence.record(step, tables, TABLES, {"load_type": step})
+        return hits
+
+    assert run_session() == []
+    assert run_session() == ["INI", "CDC"]
+    assert cache.get(CachedSequence(cache, step_keys).key).evidence == {
+        "INI": {"load_type": "INI"},
+        "CDC": {"load_type": "CDC"},
+    }
+
+    # Any change to the tables sends the whole sequence back through the DAG
+    tables["cons.dim_customer"] = T0
+    assert run_session() == []
+    assert run_session() == ["INI", "CDC"]
+
+
+@allure.feature("Result Cache")
+@allure.story("Load-Type Sequence")
+@pytest.mark.unit
+def test_sequence_stored_only_when_every_step_ran_green(tmp_path):
+    cache = LocalResultCache(tmp_path)
+    times = dict.fromkeys(TABLES, T1)
+    sequence = CachedSequence(cache, {"INI": "key-ini", "CDC": "key-cdc"})
+
+    # INI failed (never recorded); a green CDC alone does not verify the sequence
+    assert sequence.record("CDC", times, TABLES, {}) is None
+    assert cache.get(sequence.key) is None
+
+    # A single selected load type is its own sequence with its own key
+    cdc_only = CachedSequence(cache, {"CDC": "key-cdc"})
+    assert cdc_only.key != sequence.key
+    assert cdc_only.record("CDC", times, TABLES, {}) is not None
+    assert cdc_only.lookup("CDC", times)
+    assert sequence.lookup("CDC", times) is None
@@ -0,0 +1,144 @@
+import pytest
+import allure
+from framework.utils.assertions import assert_schema_lineage
+from framework.utils.schema import SchemaCatalog, load_schema_catalog
+
+
+def _row(layer, table, path, data_type, is_nullable="YES", position=1):
+    return {
+        "layer": layer,
+        "table_name": table,
+        "field_path": path,
+        "data_type": data_type,
+        "is_nullable": is_nullable,
+        "ordinal_position": position,
+    }
+
+
+ROWS = [
+    _row("raw_vault", "hub_customer", "customer_id", "INT64", "NO", 1),
+    _row("raw_vault", "hub_customer", "email", "STRING", "YES", 2),
+    _row(
+        "raw_vault",
+        "hub_customer",
+        "address",
+        "STRUCT<city STRING, zip STRING>",
+        position=3,
+    ),
+    _row("raw_vault", "hub_customer", "address.city", "STRING", position=3),
+    _row("raw_vault", "hub_customer", "address.zip", "STRING", position=3),
+    _row("raw_vault", "hub_customer", "load_ts", "TIMESTAMP", position=4),
+    _row("consumption", "dim_customer", "customer_id", "INT64", "YES", 1),
+    _row("consumption", "dim_customer", "email", "STRING", "YES", 2),
+    _row(
+        "consumption",
+        "dim_customer",
+        "address",
+        "STRUCT<city STRING, zip INT64>",
+        position=3,
+    ),
+    _row("consumption", "dim_customer", "address.city", "STRING", position=3),
+    _row("consumption", "dim_customer", "address.zip", "INT64", position=3),
+    _row("consumption", "dim_customer", "tags", "ARRAY<STRING>", position=4),
+]
+
+
+class FakeBigQueryClient:
+    project_id = "test-project"
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+
+    def execute_query(self, query, job_config=None):
+        self.queries.append(query)
+        return self.rows
+
+
+@allure.feature("Schema Consistency")
+@allure.story("Schema Catalog Diff")
+@pytest.mark.unit
+def test_schema_diff_reports_column_type_mode_and_nested_drift():
+    catalog = SchemaCatalog.from_rows(ROWS)
+
+    diff = catalog.diff("raw_vault", "hub_customer", "consumption", "dim_customer")
+
+    assert [d.field_path for d in diff.missing] == ["load_ts"]
+    assert [d.field_path for d in diff.extra] == ["tags"]
+    assert [(d.field_path, d.left, d.right) for d in diff.type_changes] == [
+        ("address.zip", "STRING", "INT64")
+    ]
+    assert [(d.field_path, d.left, d.right) for d in diff.mode_changes] == [
+        ("customer_id", "REQUIRED", "NULLABLE")
+    ]
+    assert [d.field_path for d in diff.nested] == ["address.zip"]
+    assert catalog.get_columns("consumption", "dim_customer")["tags"].mode == "REPEATED"
+
+
+@allure.feature("Schema Consistency")
+@allure.story("Schema Catalog Diff")
+@pytest.mark.unit
+def test_schema_diff_identical_tables_is_empty():
+    catalog = SchemaCatalog.from_rows(ROWS)
+
+    diff = catalog.diff("raw_vault", "hub_customer", "raw_vault", "hub_customer")
+
+    assert not diff
+    assert "No schema drift" in diff.summary()
+
+
+@allure.feature("Schema Consistency")
+@allure.story("Schema Catalog Load")
+@pytest.mark.unit
+def test_load_schema_catalog_uses_single_query_for_all_layers():
+    client = FakeBigQueryClient(ROWS)
+    layers = {
+        "raw_structured": "rs",
+        "raw_vault": "rv",
+        "business_vault": "bv",
+        "consumption": "cons",
+    }
+
+    catalog = load_schema_catalog(client, layers)
+
+    assert len(client.queries) == 1
+    for dataset in layers.values():
+        assert f"`test-project.{dataset}`.INFORMATION_SCHEMA.COLUMN_FIELD_PATHS" in (
+            client.queries[0]
+        )
+    assert catalog.tables() == [
+        ("consumption", "dim_customer"),
+        ("raw_vault", "hub_customer"),
+    ]
+    with pytest.raises(KeyError):
+        catalog.get_columns("business_vault", "bv_customer_360")
+
+
+@allure.feature("Schema Consistency")
+@allure.story("Schema Lineage Assertion")
+@pytest.mark.unit
+def test_assert_schema_lineage_fails_on_drift_and_ignores_extra_columns():
+    catalog = SchemaCatalog.from_rows(ROWS)
+
+    assert_schema_lineage(
+        catalog, ("raw_vault", "hub_customer"), ("raw_vault", "hub_customer")
+    )
+    with pytest.raises(AssertionError) as error:
+        assert_schema_lineage(
+            catalog, ("raw_vault", "hub_customer"), ("consumption", "dim_customer")
+        )
+
+    message = str(error.value)
+    assert (
+        "load_ts" in message and "address.zip" in message and "customer_id" in message
+    )
+    assert "tags" not in message
+
+    with pytest.raises(AssertionError) as error:
+        assert_schema_lineage(
+            catalog,
+            ("raw_vault", "hub_customer"),
+            ("consumption", "dim_customer"),
+            check_modes=False,
+        )
+    assert "customer_id" not in str(error.value)